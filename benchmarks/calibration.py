@@ -0,0 +1,74 @@
+"""
+Benchmarks for implied volatility inversion, quote by quote and on a full chain.
+"""
+
+from quant_forge.calibration import implied_volatility
+from quant_forge.market import compute_implied_volatility
+from quant_forge.models.black_scholes import black_scholes_price
+
+import numpy as np
+import pandas as pd
+
+import time
+
+
+class ImpliedVolatilitySuite:
+    params = ([0.7, 0.9, 1.0, 1.1, 1.3], ["call", "put"])
+    param_names = ["moneyness", "option_type"]
+
+    def setup(self, moneyness: float, option_type: str) -> None:
+        self.strike = 100.0 * moneyness
+        self.price = black_scholes_price(100.0, self.strike, 0.5, 0.03, 0.25, option_type)
+
+    def time_implied_volatility(self, moneyness: float, option_type: str) -> None:
+        implied_volatility(self.price, 100.0, self.strike, 0.5, 0.03, option_type)
+
+    def peakmem_implied_volatility(self, moneyness: float, option_type: str) -> None:
+        implied_volatility(self.price, 100.0, self.strike, 0.5, 0.03, option_type)
+
+    def track_quotes_per_second(self, moneyness: float, option_type: str) -> float:
+        start = time.perf_counter()
+        implied_volatility(self.price, 100.0, self.strike, 0.5, 0.03, option_type)
+        return 1 / (time.perf_counter() - start)
+
+    track_quotes_per_second.unit = "quotes/s"
+
+
+class ComputeImpliedVolatilitySuite:
+    params = [100, 1_000]
+    param_names = ["n_quotes"]
+
+    def setup(self, n_quotes: int) -> None:
+        rng = np.random.default_rng(0)
+        strikes = rng.uniform(70.0, 130.0, n_quotes)
+        days = rng.integers(30, 730, n_quotes)
+        expirations = pd.Timestamp.today().normalize() + pd.to_timedelta(days, unit="D")
+        # Recompute the maturity the same way `compute_implied_volatility` does.
+        time_to_maturity = (expirations - pd.Timestamp.today()).days.to_numpy() / 365
+        sigmas = 0.2 + 0.1 * (strikes / 100.0 - 1.0) ** 2
+        prices = [
+            black_scholes_price(100.0, k, t, 0.03, sigma, "call")
+            for k, t, sigma in zip(strikes, time_to_maturity, sigmas)
+        ]
+        self.chain = pd.DataFrame(
+            {
+                "Symbol": "SYN",
+                "Expiration": expirations.strftime("%Y-%m-%d"),
+                "Price": prices,
+                "Strike": strikes,
+                "Type": "Call",
+            }
+        )
+
+    def time_compute_implied_volatility(self, n_quotes: int) -> None:
+        compute_implied_volatility(self.chain.copy(), 100.0, 0.03)
+
+    def peakmem_compute_implied_volatility(self, n_quotes: int) -> None:
+        compute_implied_volatility(self.chain.copy(), 100.0, 0.03)
+
+    def track_quotes_per_second(self, n_quotes: int) -> float:
+        start = time.perf_counter()
+        compute_implied_volatility(self.chain.copy(), 100.0, 0.03)
+        return n_quotes / (time.perf_counter() - start)
+
+    track_quotes_per_second.unit = "quotes/s"
@@ -0,0 +1,53 @@
+"""
+Benchmarks for the payoff evaluation of every contract.
+"""
+
+from quant_forge.contracts import (
+    AsianCall,
+    AsianPut,
+    DigitalCall,
+    DigitalPut,
+    EuropeanCall,
+    EuropeanPut,
+    Lookback,
+)
+from quant_forge.models import BlackScholes
+from quant_forge.simulations import PathSimulator
+
+import numpy as np
+
+import time
+
+CONTRACTS = {
+    "EuropeanCall": lambda: EuropeanCall(1.0, 100.0),
+    "EuropeanPut": lambda: EuropeanPut(1.0, 100.0),
+    "AsianCall": lambda: AsianCall(1.0, 100.0),
+    "AsianPut": lambda: AsianPut(1.0, 100.0),
+    "DigitalCall": lambda: DigitalCall(1.0, 100.0, 1.0),
+    "DigitalPut": lambda: DigitalPut(1.0, 100.0, 1.0),
+    "Lookback": lambda: Lookback(1.0, 0.2),
+}
+
+
+class PayoffSuite:
+    params = (list(CONTRACTS), [10_000, 100_000])
+    param_names = ["contract", "n_paths"]
+
+    def setup(self, contract: str, n_paths: int) -> None:
+        np.random.seed(0)
+        simulator = PathSimulator(BlackScholes(interest_rate=0.03, sigma=0.2))
+        self.paths = simulator.simulate(100.0, 1.0, 100, n_paths, scheme="exact")
+        self.contract = CONTRACTS[contract]()
+
+    def time_payoff(self, contract: str, n_paths: int) -> None:
+        self.contract.payoff(self.paths)
+
+    def peakmem_payoff(self, contract: str, n_paths: int) -> None:
+        self.contract.payoff(self.paths)
+
+    def track_paths_per_second(self, contract: str, n_paths: int) -> float:
+        start = time.perf_counter()
+        self.contract.payoff(self.paths)
+        return n_paths / (time.perf_counter() - start)
+
+    track_paths_per_second.unit = "paths/s"
@@ -0,0 +1,37 @@
+"""
+Import-time benchmarks, measured in a fresh interpreter.
+
+`import quant_forge` and the core subpackages must not load the market stack
+(pandas, plotly, yfinance) nor scipy.stats, see `quant_forge._lazy`.
+"""
+
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "plotly", "yfinance", "scipy.stats", "scipy.interpolate"]
+
+_COUNT_LOADED = """
+import importlib, sys
+importlib.import_module({module!r})
+print(sum(name in sys.modules for name in {heavy!r}))
+"""
+
+
+class ImportSuite:
+    params = [
+        "quant_forge",
+        "quant_forge.simulations",
+        "quant_forge.contracts",
+        "quant_forge.calibration",
+    ]
+    param_names = ["module"]
+
+    def timeraw_import(self, module: str) -> str:
+        return f"import {module}"
+
+    def track_heavy_modules_loaded(self, module: str) -> int:
+        code = _COUNT_LOADED.format(module=module, heavy=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        return int(output.stdout)
+
+    track_heavy_modules_loaded.unit = "modules"
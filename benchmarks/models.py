@@ -0,0 +1,43 @@
+"""
+Benchmarks for the Black-Scholes closed form price and Greeks.
+"""
+
+from quant_forge.models import black_scholes as bs
+
+import numpy as np
+
+import time
+
+
+class GreeksSuite:
+    params = (["price", "delta", "gamma", "vega", "theta", "rho"], [1, 100_000])
+    param_names = ["greek", "n_quotes"]
+
+    def setup(self, greek: str, n_quotes: int) -> None:
+        functions = {
+            "price": bs.black_scholes_price,
+            "delta": bs.delta,
+            "gamma": bs.gamma,
+            "vega": bs.vega,
+            "theta": bs.theta,
+            "rho": bs.rho,
+        }
+        self.function = functions[greek]
+        self.kwargs = {} if greek in ("gamma", "vega") else {"option_type": "call"}
+        # Scalar quotes for n_quotes = 1, arrays of strikes otherwise.
+        self.strike = 105.0 if n_quotes == 1 else np.random.default_rng(0).uniform(70.0, 130.0, n_quotes)
+        # Import scipy.stats, loaded lazily on first use, outside of the one-shot measurements.
+        self.function(100.0, self.strike, 0.5, 0.03, 0.2, **self.kwargs)
+
+    def time_greek(self, greek: str, n_quotes: int) -> None:
+        self.function(100.0, self.strike, 0.5, 0.03, 0.2, **self.kwargs)
+
+    def peakmem_greek(self, greek: str, n_quotes: int) -> None:
+        self.function(100.0, self.strike, 0.5, 0.03, 0.2, **self.kwargs)
+
+    def track_quotes_per_second(self, greek: str, n_quotes: int) -> float:
+        start = time.perf_counter()
+        self.function(100.0, self.strike, 0.5, 0.03, 0.2, **self.kwargs)
+        return n_quotes / (time.perf_counter() - start)
+
+    track_quotes_per_second.unit = "quotes/s"
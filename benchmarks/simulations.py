@@ -0,0 +1,65 @@
+"""
+Benchmarks for the path simulation engine.
+"""
+
+from quant_forge.models import BlackScholes
+from quant_forge.simulations import NormalPipeline, PathSimulator
+
+import numpy as np
+
+import time
+
+
+class PathSimulatorSuite:
+    params = (["euler", "exact"], [1_000, 10_000, 100_000], [10, 100, 250])
+    param_names = ["scheme", "n_paths", "n_steps"]
+
+    def setup(self, scheme: str, n_paths: int, n_steps: int) -> None:
+        # Keep the largest grid point (25M steps, ~400MB of paths and increments) out of the suite.
+        if n_paths * n_steps > 10_000_000:
+            raise NotImplementedError
+        np.random.seed(0)
+        self.simulator = PathSimulator(BlackScholes(interest_rate=0.03, sigma=0.2))
+
+    def time_simulate(self, scheme: str, n_paths: int, n_steps: int) -> None:
+        self.simulator.simulate(100.0, 1.0, n_steps, n_paths, scheme=scheme)
+
+    def peakmem_simulate(self, scheme: str, n_paths: int, n_steps: int) -> None:
+        self.simulator.simulate(100.0, 1.0, n_steps, n_paths, scheme=scheme)
+
+    def track_steps_per_second(self, scheme: str, n_paths: int, n_steps: int) -> float:
+        start = time.perf_counter()
+        self.simulator.simulate(100.0, 1.0, n_steps, n_paths, scheme=scheme)
+        return n_paths * n_steps / (time.perf_counter() - start)
+
+    track_steps_per_second.unit = "path steps/s"
+
+
+class PathSimulatorLayoutSuite:
+    params = (["euler", "exact"], ["float64", "float32"], ["path_major", "time_major"])
+    param_names = ["scheme", "dtype", "layout"]
+
+    def setup(self, scheme: str, dtype: str, layout: str) -> None:
+        self.simulator = PathSimulator(BlackScholes(interest_rate=0.03, sigma=0.2))
+        self.rng = np.random.default_rng(0)
+
+    def time_simulate(self, scheme: str, dtype: str, layout: str) -> None:
+        self.simulator.simulate(100.0, 1.0, 100, 100_000, scheme=scheme, dtype=dtype, layout=layout, rng=self.rng)
+
+    def peakmem_simulate(self, scheme: str, dtype: str, layout: str) -> None:
+        self.simulator.simulate(100.0, 1.0, 100, 100_000, scheme=scheme, dtype=dtype, layout=layout, rng=self.rng)
+
+
+class PipelinedPathSimulatorSuite:
+    params = (["euler", "exact"], [0, 1, 2, 4])
+    param_names = ["scheme", "n_threads"]
+
+    def setup(self, scheme: str, n_threads: int) -> None:
+        self.simulator = PathSimulator(BlackScholes(interest_rate=0.03, sigma=0.2))
+        self.normals = NormalPipeline(0, n_threads=n_threads, block_steps=16)
+
+    def time_simulate(self, scheme: str, n_threads: int) -> None:
+        self.simulator.simulate(100.0, 1.0, 250, 100_000, scheme=scheme, normals=self.normals)
+
+    def peakmem_simulate(self, scheme: str, n_threads: int) -> None:
+        self.simulator.simulate(100.0, 1.0, 250, 100_000, scheme=scheme, normals=self.normals)
@@ -12,7 +12,7 @@ def _(mo):
 
 @app.cell
 def _(mo):
-    callout = mo.callout("""Ensure that `quant-forge` is installed using `pip install -e .`""", kind="warn")
+    callout = mo.callout("""Ensure that `quant-forge` is installed using `pip install -e ".[market]"`""", kind="warn")
     mo.md(f"""{callout}""")
     return (callout,)
 
@@ -1,7 +1,63 @@
-from . import calibration
-from . import contracts
-from . import models
-from . import market
-from . import simulations
+from ._lazy import attach
 
-__all__ = calibration.__all__ + contracts.__all__ + market.__all__ + models.__all__ + simulations.__all__
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["calibration", "contracts", "instrumentation", "market", "models", "risk", "service", "simulations"],
+    exports={
+        # calibration
+        "implied_volatility": "calibration",
+        "implied_volatilities": "calibration",
+        "black_scholes_price": "calibration",
+        "OptionSurface": "calibration",
+        "CalibrationResult": "calibration",
+        "calibrate_surface": "calibration",
+        "calibrate_surfaces": "calibration",
+        # contracts
+        "AsianContract": "contracts",
+        "AsianCall": "contracts",
+        "AsianPut": "contracts",
+        "BarrierContract": "contracts",
+        "BarrierCall": "contracts",
+        "BarrierPut": "contracts",
+        "Contract": "contracts",
+        "DigitalContract": "contracts",
+        "DigitalCall": "contracts",
+        "DigitalPut": "contracts",
+        "EuropeanContract": "contracts",
+        "EuropeanCall": "contracts",
+        "EuropeanPut": "contracts",
+        "Lookback": "contracts",
+        # instrumentation
+        "Stats": "instrumentation",
+        "instrument": "instrumentation",
+        # market
+        "get_stock_data": "market",
+        "get_options_data": "market",
+        "filter_options_data": "market",
+        "get_options_surface_data": "market",
+        "compute_implied_volatility": "market",
+        "plot_surface": "market",
+        # models
+        "BaseModel": "models",
+        "BlackScholes": "models",
+        "digital_price": "models",
+        "delta": "models",
+        "gamma": "models",
+        "vega": "models",
+        "theta": "models",
+        "rho": "models",
+        # risk
+        "Position": "risk",
+        "ScenarioResult": "risk",
+        "revalue_scenarios": "risk",
+        # service
+        "PricingClient": "service",
+        "PricingServer": "service",
+        # simulations
+        "MLMCResult": "simulations",
+        "MultilevelMonteCarlo": "simulations",
+        "NormalPipeline": "simulations",
+        "PathSimulator": "simulations",
+        "PathStore": "simulations",
+    },
+)
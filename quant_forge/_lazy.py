@@ -0,0 +1,136 @@
+"""
+Helpers for deferring imports until first use.
+
+Packages expose their public names through a module level ``__getattr__`` (PEP 562)
+so that ``import quant_forge`` only costs the import of this module, and heavy
+third-party modules are wrapped in lazy module objects that are imported on first
+attribute access.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+
+from types import ModuleType
+from typing import Callable, Optional
+
+
+def _missing_dependency(name: str, extra: Optional[str]) -> ImportError:
+    message = f"'{name}' is required for this feature but is not installed"
+    if extra is not None:
+        message += f", install it with `pip install quant-forge[{extra}]`"
+    return ImportError(message)
+
+
+class _LazyModule(ModuleType):
+    """
+    A stand-in for a module, imported on first attribute access.
+
+    The import runs under a lock, so concurrent first uses from several threads all wait for
+    the fully executed module, unlike `importlib.util.LazyLoader`.
+    """
+
+    def __init__(self, name: str, extra: Optional[str]):
+        super().__init__(name)
+        self._extra = extra
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        with self._lock:
+            if self._module is None:
+                try:
+                    self._module = importlib.import_module(self.__name__)
+                except ModuleNotFoundError as e:
+                    raise _missing_dependency(self.__name__.split(".")[0], self._extra) from e
+            return self._module
+
+    def __getattr__(self, name: str) -> object:
+        module = self._module if self._module is not None else self._load()
+        return getattr(module, name)
+
+
+def lazy_import(name: str, *, extra: Optional[str] = None) -> ModuleType:
+    """
+    Return a module which is only imported on first attribute access.
+
+    Parameters
+    ----------
+    name : str
+        Fully qualified module name, e.g. ``"scipy.stats"``.
+    extra : str, optional
+        Name of the optional dependency group providing the module, used in the
+        error message when the module is not installed.
+
+    Returns
+    -------
+    ModuleType
+        The module if it is already imported, or a stand-in importing it on first use.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    try:
+        spec = importlib.util.find_spec(name)
+    except ModuleNotFoundError:
+        spec = None
+    if spec is None:
+        raise _missing_dependency(name.split(".")[0], extra)
+
+    return _LazyModule(name, extra)
+
+
+def attach(
+    package: str,
+    submodules: list[str],
+    exports: dict[str, str],
+    *,
+    extra: Optional[str] = None,
+) -> tuple[Callable[[str], object], Callable[[], list[str]], list[str]]:
+    """
+    Build the ``__getattr__``, ``__dir__`` and ``__all__`` of a lazily loaded package.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, usually ``__name__``.
+    submodules : list[str]
+        Submodules imported on first access of ``package.<submodule>``.
+    exports : dict[str, str]
+        Mapping of public names to the submodule defining them.
+    extra : str, optional
+        Name of the optional dependency group required by the package.
+
+    Returns
+    -------
+    tuple
+        The ``__getattr__`` and ``__dir__`` functions and the ``__all__`` list.
+    """
+
+    def __getattr__(name: str) -> object:
+        if name in submodules:
+            module_name = name
+        elif name in exports:
+            module_name = exports[name]
+        else:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        try:
+            module = importlib.import_module(f"{package}.{module_name}")
+        except ModuleNotFoundError as e:
+            if extra is None or e.name is None or e.name.startswith(package.split(".")[0]):
+                raise
+            raise _missing_dependency(e.name.split(".")[0], extra) from e
+
+        if name in submodules:
+            return module
+
+        value = getattr(module, name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(submodules) | set(exports))
+
+    return __getattr__, __dir__, list(exports)
@@ -1,3 +1,9 @@
-from .implied_volatility import implied_volatility, black_scholes_price
+from .implied_volatility import implied_volatility, implied_volatilities, black_scholes_price
+from .surface import OptionSurface, CalibrationResult, calibrate_surface, calibrate_surfaces
 
-__all__ = ["implied_volatility", "black_scholes_price"]
+__all__ = ["implied_volatility", "implied_volatilities", "black_scholes_price"] + [
+    "OptionSurface",
+    "CalibrationResult",
+    "calibrate_surface",
+    "calibrate_surfaces",
+]
@@ -1,11 +1,14 @@
 """
 Implements implied volatility calculations for option pricing,
-particularly using the Newton-Raphson method for inverting the Black-Scholes formula.
+particularly using the Newton-Raphson method for inverting the Black-Scholes formula,
+for a single option or a whole batch of options at once.
 """
 
-from ..models.black_scholes import black_scholes_price, vega
+from ..instrumentation import count
+from ..models.black_scholes import black_scholes_price, call_mask, vega
 
 import numpy as np
+import numpy.typing as npt
 
 from typing import Literal
 
@@ -45,21 +48,116 @@ def implied_volatility(
     tol = 1e-5
     iv = 0.3
 
-    for _ in range(max_iterations):
+    count("implied_volatility.calls")
+    for i in range(max_iterations):
         bs_price = black_scholes_price(s, strike, time_to_maturity, interest_rate, iv, option_type)
         vg = vega(s, strike, time_to_maturity, interest_rate, iv)
         if vg == 0:
+            count("implied_volatility.iterations", i + 1)
+            count("implied_volatility.non_converged")
             return np.nan
 
         diff = bs_price - market_price
         iv_new = iv - diff / vg
         if iv_new < 0 or iv_new > 2:
+            count("implied_volatility.iterations", i + 1)
+            count("implied_volatility.non_converged")
             return np.nan
 
         bs_price_new = black_scholes_price(s, strike, time_to_maturity, interest_rate, iv_new, option_type)
         if np.abs(iv - iv_new) < tol or np.abs(bs_price_new - market_price) < tol or vg < tol:
+            count("implied_volatility.iterations", i + 1)
             break
 
         iv = iv_new
+    else:
+        count("implied_volatility.iterations", max_iterations)
+        count("implied_volatility.non_converged")
 
     return iv
+
+
+def implied_volatilities(
+    market_prices: npt.ArrayLike,
+    s: npt.ArrayLike,
+    strike: npt.ArrayLike,
+    time_to_maturity: npt.ArrayLike,
+    interest_rate: npt.ArrayLike,
+    option_type: npt.ArrayLike,
+) -> np.ndarray:
+    """
+    Calculate the implied volatilities of many options at once, with the Newton-Raphson
+    iterations of `implied_volatility` run on the whole batch in vectorized form.
+
+    Parameters
+    ----------
+    market_prices : ArrayLike
+        Market price of each option.
+    s : ArrayLike
+        Current asset price.
+    strike : ArrayLike
+        Strike price.
+    time_to_maturity : ArrayLike
+        Time to maturity.
+    interest_rate : ArrayLike
+        Risk-free interest rate.
+    option_type : ArrayLike
+        'call' or 'put', for each option.
+
+    Returns
+    -------
+    np.ndarray
+        The implied volatilities, the same as `implied_volatility` elementwise, NaN where it fails.
+    """
+    max_iterations = 200
+    tol = 1e-5
+
+    market_prices, s, strike, time_to_maturity, interest_rate = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (market_prices, s, strike, time_to_maturity, interest_rate))
+    )
+    is_call = np.broadcast_to(call_mask(option_type), market_prices.shape)
+    shape = market_prices.shape
+    market_prices, s, strike, time_to_maturity, interest_rate, is_call = (
+        x.ravel() for x in (market_prices, s, strike, time_to_maturity, interest_rate, is_call)
+    )
+
+    def price(idx: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+        args = (s[idx], strike[idx], time_to_maturity[idx], interest_rate[idx])
+        call = black_scholes_price(*args, sigma, "call")
+        # Put prices from the put-call parity.
+        put = call - args[0] + args[1] * np.exp(-args[3] * args[2])
+        return np.where(is_call[idx], call, put)
+
+    ivs = np.full(len(market_prices), np.nan)
+    iv = np.full(len(market_prices), 0.3)
+    active = np.arange(len(market_prices))
+    iterations = 0
+
+    count("implied_volatility.calls", len(market_prices))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iterations):
+            if len(active) == 0:
+                break
+            iterations += len(active)
+
+            vg = vega(s[active], strike[active], time_to_maturity[active], interest_rate[active], iv[active])
+            iv_new = iv[active] - (price(active, iv[active]) - market_prices[active]) / vg
+            failed = (vg == 0) | (iv_new < 0) | (iv_new > 2) | np.isnan(iv_new)
+
+            converged = ~failed & (
+                (np.abs(iv[active] - iv_new) < tol)
+                | (np.abs(price(active, iv_new) - market_prices[active]) < tol)
+                | (vg < tol)
+            )
+            ivs[active[converged]] = iv[active[converged]]
+
+            running = ~failed & ~converged
+            iv[active[running]] = iv_new[running]
+            count("implied_volatility.non_converged", np.count_nonzero(failed))
+            active = active[running]
+
+    # Like `implied_volatility`, the last iterate is returned when the iterations run out.
+    ivs[active] = iv[active]
+    count("implied_volatility.iterations", iterations)
+    count("implied_volatility.non_converged", len(active))
+    return ivs.reshape(shape)
@@ -0,0 +1,279 @@
+"""
+Implements the calibration of model parameters to whole option surfaces, by weighted
+non-linear least squares on the price residuals of every quote at once.
+"""
+
+from .._lazy import lazy_import
+from ..models import BaseModel
+from ..models.black_scholes import vega
+
+import numpy as np
+import numpy.typing as npt
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Literal, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+optimize = lazy_import("scipy.optimize")
+
+
+class OptionSurface:
+    """
+    Market quotes of European options on a single underlying.
+    """
+
+    def __init__(
+        self,
+        spot: float,
+        strikes: npt.ArrayLike,
+        maturities: npt.ArrayLike,
+        prices: npt.ArrayLike,
+        option_types: npt.ArrayLike,
+    ):
+        """
+        Initialize a surface from arrays of quotes.
+
+        Parameters
+        ----------
+        spot : float
+            Current price of the underlying.
+        strikes : ArrayLike
+            Strike price of each quote.
+        maturities : ArrayLike
+            Time to maturity of each quote, in years.
+        prices : ArrayLike
+            Market price of each quote.
+        option_types : ArrayLike
+            'call' or 'put', for each quote.
+        """
+        self._spot = spot
+        self._strikes = np.asarray(strikes, dtype=float)
+        self._maturities = np.asarray(maturities, dtype=float)
+        self._prices = np.asarray(prices, dtype=float)
+        self._option_types = np.char.lower(np.broadcast_to(np.asarray(option_types, dtype=str), self._prices.shape))
+
+    @classmethod
+    def from_dataframe(cls, options_data: "pd.DataFrame", spot_price: float) -> "OptionSurface":
+        """
+        Build a surface from options data as returned by `market.get_options_data`.
+        """
+        import pandas as pd
+
+        time_to_maturity = (pd.to_datetime(options_data["Expiration"]) - pd.Timestamp.today()).dt.days / 365
+        return cls(
+            spot_price,
+            options_data["Strike"].to_numpy(),
+            time_to_maturity.to_numpy(),
+            options_data["Price"].to_numpy(),
+            options_data["Type"].to_numpy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    @property
+    def spot(self) -> float:
+        return self._spot
+
+    @property
+    def strikes(self) -> np.ndarray:
+        return self._strikes
+
+    @property
+    def maturities(self) -> np.ndarray:
+        return self._maturities
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices
+
+    @property
+    def option_types(self) -> np.ndarray:
+        return self._option_types
+
+
+class CalibrationResult:
+    """
+    Result of the calibration of a model to an option surface.
+    """
+
+    def __init__(self, model: BaseModel, residuals: np.ndarray, success: bool, n_evaluations: int, message: str):
+        self._model = model
+        self._residuals = residuals
+        self._success = success
+        self._n_evaluations = n_evaluations
+        self._message = message
+
+    @property
+    def model(self) -> BaseModel:
+        """
+        The calibrated model.
+        """
+        return self._model
+
+    @property
+    def parameters(self) -> dict[str, float]:
+        """
+        The calibrated parameters, to warm-start the next calibration.
+        """
+        return self._model.parameters
+
+    @property
+    def residuals(self) -> np.ndarray:
+        """
+        The weighted price residual of each quote.
+        """
+        return self._residuals
+
+    @property
+    def rmse(self) -> float:
+        return float(np.sqrt(np.mean(self._residuals**2)))
+
+    @property
+    def success(self) -> bool:
+        return self._success
+
+    @property
+    def n_evaluations(self) -> int:
+        return self._n_evaluations
+
+    @property
+    def message(self) -> str:
+        return self._message
+
+
+def calibrate_surface(
+    model_type: type[BaseModel],
+    surface: OptionSurface,
+    initial: dict[str, float],
+    *,
+    fixed: Optional[dict[str, float]] = None,
+    weighting: Literal["vega", "none"] = "vega",
+    weight_vol: float = 0.2,
+    jacobian: Literal["analytic", "cs", "2-point", "3-point"] = "analytic",
+    bounds: Optional[dict[str, tuple[float, float]]] = None,
+) -> CalibrationResult:
+    """
+    Fit the parameters of a model to every quote of an option surface.
+
+    The residuals of all the quotes are computed in one vectorized call of `model.price`, and
+    minimized with `scipy.optimize.least_squares`.
+
+    Parameters
+    ----------
+    model_type : type[BaseModel]
+        The model class, built from its parameters as keyword arguments. It must implement `price`.
+    surface : OptionSurface
+        The market quotes.
+    initial : dict[str, float]
+        Initial value of each fitted parameter, e.g. yesterday's calibrated parameters.
+    fixed : dict[str, float], optional
+        Parameters held constant, e.g. {"interest_rate": 0.03}.
+    weighting : Literal['vega', 'none'], optional
+        With "vega", price residuals are divided by the Black-Scholes vega of the quote, which
+        approximates implied volatility residuals. By default "vega".
+    weight_vol : float, optional
+        Volatility at which the weighting vegas are computed, by default 0.2.
+    jacobian : Literal['analytic', 'cs', '2-point', '3-point'], optional
+        "analytic" uses `model.price_gradient`, and falls back to "3-point" finite differences if the
+        model has none. "cs" is the complex-step Jacobian, for models whose price supports complex
+        parameters. By default "analytic".
+    bounds : dict[str, tuple[float, float]], optional
+        Bounds of the fitted parameters, by default `model_type.parameter_bounds`.
+
+    Returns
+    -------
+    CalibrationResult
+        The calibrated model and the residuals.
+    """
+    fixed = dict(fixed or {})
+    names = [name for name in initial if name not in fixed]
+    bounds = {**model_type.parameter_bounds, **(bounds or {})}
+    lower = np.array([bounds.get(name, (-np.inf, np.inf))[0] for name in names])
+    upper = np.array([bounds.get(name, (-np.inf, np.inf))[1] for name in names])
+    x0 = np.clip([initial[name] for name in names], lower, upper)
+
+    quotes = (surface.spot, surface.strikes, surface.maturities, surface.option_types)
+    if weighting == "vega":
+        interest_rate = fixed.get("interest_rate", initial.get("interest_rate", 0.0))
+        weights = vega(surface.spot, surface.strikes, surface.maturities, interest_rate, weight_vol)
+        weights = np.maximum(weights, 1e-4 * surface.spot)
+    elif weighting == "none":
+        weights = np.ones(len(surface))
+    else:
+        raise ValueError(f"Unknown weighting: {weighting}")
+
+    def build(x: np.ndarray) -> BaseModel:
+        return model_type(**fixed, **dict(zip(names, x)))
+
+    def residuals(x: np.ndarray) -> np.ndarray:
+        return (build(x).price(*quotes) - surface.prices) / weights
+
+    def analytic_jacobian(x: np.ndarray) -> np.ndarray:
+        gradient = build(x).price_gradient(*quotes)
+        return np.column_stack([np.broadcast_to(gradient[name], weights.shape) / weights for name in names])
+
+    jac = jacobian
+    if jacobian == "analytic":
+        try:
+            analytic_jacobian(x0)
+            jac = analytic_jacobian
+        except NotImplementedError:
+            jac = "3-point"
+
+    result = optimize.least_squares(residuals, x0, jac=jac, bounds=(lower, upper), method="trf", x_scale="jac")
+    return CalibrationResult(build(result.x), result.fun, bool(result.success), int(result.nfev), result.message)
+
+
+def _calibrate_surface_task(args: tuple) -> CalibrationResult:
+    model_type, surface, initial, kwargs = args
+    return calibrate_surface(model_type, surface, initial, **kwargs)
+
+
+def calibrate_surfaces(
+    model_type: type[BaseModel],
+    surfaces: dict[str, OptionSurface],
+    initial: dict[str, float],
+    *,
+    warm_start: Optional[dict[str, dict[str, float]]] = None,
+    max_workers: Optional[int] = None,
+    **kwargs,
+) -> dict[str, CalibrationResult]:
+    """
+    Calibrate a model to the surfaces of many underlyings in parallel processes.
+
+    Parameters
+    ----------
+    model_type : type[BaseModel]
+        The model class, see `calibrate_surface`.
+    surfaces : dict[str, OptionSurface]
+        The market quotes, by ticker.
+    initial : dict[str, float]
+        Initial value of each fitted parameter, for the tickers without warm start.
+    warm_start : dict[str, dict[str, float]], optional
+        Initial parameters by ticker, e.g. the `parameters` of yesterday's results.
+    max_workers : int, optional
+        Number of worker processes, by default the number of CPUs. With 1, surfaces are calibrated
+        in the calling process.
+    **kwargs
+        Keyword arguments of `calibrate_surface`.
+
+    Returns
+    -------
+    dict[str, CalibrationResult]
+        The calibration results, by ticker.
+    """
+    warm_start = warm_start or {}
+    tasks = [
+        (model_type, surface, {**initial, **warm_start.get(ticker, {})}, kwargs) for ticker, surface in surfaces.items()
+    ]
+
+    if max_workers == 1:
+        results = [_calibrate_surface_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_calibrate_surface_task, tasks))
+
+    return dict(zip(surfaces, results))
@@ -1,4 +1,5 @@
 from .asian import AsianContract, AsianCall, AsianPut
+from .barrier import BarrierContract, BarrierCall, BarrierPut
 from .contract import Contract
 from .digital import DigitalContract, DigitalCall, DigitalPut
 from .european import EuropeanContract, EuropeanCall, EuropeanPut
@@ -8,6 +9,9 @@ __all__ = [
     "AsianContract",
     "AsianCall",
     "AsianPut",
+    "BarrierContract",
+    "BarrierCall",
+    "BarrierPut",
     "Contract",
     "DigitalContract",
     "DigitalCall",
@@ -8,6 +8,7 @@ from .contract import Contract
 import numpy as np
 
 from abc import abstractmethod
+from typing import Literal
 
 
 class AsianContract(Contract):
@@ -30,6 +31,17 @@ class AsianContract(Contract):
     def strike(self) -> float:
         return self._strike
 
+    def _average(self, paths: np.ndarray, layout: Literal["path_major", "time_major"]) -> np.ndarray:
+        """
+        Trapezoidal time average of the paths, accumulated in at least float64 precision.
+        """
+        paths = self._path_major(paths, layout)
+        accumulator = np.promote_types(paths.dtype, np.float64)
+        dt = self.maturity / (paths.shape[1] - 1)
+        s = np.sum(paths[:, 1:-1], axis=1, dtype=accumulator)
+        s += (paths[:, 0].astype(accumulator) + paths[:, -1]) / 2
+        return (dt * s).astype(paths.dtype, copy=False)
+
 
 class AsianCall(AsianContract):
     """
@@ -39,9 +51,13 @@ class AsianCall(AsianContract):
     def __init__(self, maturity: float, strike: float) -> None:
         super().__init__(maturity, strike)
 
-    def payoff(self, paths: np.ndarray) -> np.ndarray:
-        dt = self.maturity / (paths.shape[1] - 1)
-        s = dt * np.sum(paths[:, 1:] + paths[:, :-1], axis=1) / 2
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
+        s = self._average(paths, layout)
         return np.maximum(s - self.strike, 0)
 
     @property
@@ -57,9 +73,13 @@ class AsianPut(AsianContract):
     def __init__(self, maturity: float, strike: float) -> None:
         super().__init__(maturity, strike)
 
-    def payoff(self, paths: np.ndarray) -> np.ndarray:
-        dt = self.maturity / (paths.shape[1] - 1)
-        s = dt * np.sum(paths[:, 1:] + paths[:, :-1], axis=1) / 2
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
+        s = self._average(paths, layout)
         return np.maximum(self.strike - s, 0)
 
     @property
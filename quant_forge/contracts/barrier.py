@@ -0,0 +1,192 @@
+"""
+Provides a base class for barrier options contracts and concrete
+subclasses for barrier calls and puts.
+
+Continuous monitoring of the barrier is recovered from a discrete time grid with the
+Brownian-bridge probability of crossing the barrier between two grid points, so the
+payoff is accurate on coarse grids. The survival probability is a running product over
+time steps and can be accumulated while stepping, without storing the paths.
+"""
+
+from .contract import Contract
+
+import numpy as np
+
+from abc import abstractmethod
+from typing import Iterable, Literal
+
+
+class BarrierContract(Contract):
+    """
+    Abstract base class for knock-in and knock-out barrier options.
+    """
+
+    @abstractmethod
+    def __init__(
+        self,
+        maturity: float,
+        strike: float,
+        barrier: float,
+        vol: float,
+        barrier_type: Literal["up-and-out", "up-and-in", "down-and-out", "down-and-in"],
+    ):
+        """
+        Initialize a barrier contract.
+
+        Parameters
+        ----------
+        maturity : float
+            The maturity (expiration time) of the option.
+        strike : float
+            The strike price at which the option can be exercised.
+        barrier : float
+            The barrier level.
+        vol : float
+            The volatility of the underlying, used by the Brownian-bridge crossing probability.
+        barrier_type : Literal['up-and-out', 'up-and-in', 'down-and-out', 'down-and-in']
+            The direction of the barrier and whether crossing it knocks the option out or in.
+        """
+        if barrier_type not in ("up-and-out", "up-and-in", "down-and-out", "down-and-in"):
+            raise ValueError(f"Unknown barrier type: {barrier_type}")
+
+        super().__init__(maturity)
+        self._strike = strike
+        self._barrier = barrier
+        self.vol = vol
+        self._barrier_type = barrier_type
+
+    @property
+    def strike(self) -> float:
+        return self._strike
+
+    @property
+    def barrier(self) -> float:
+        return self._barrier
+
+    @property
+    def barrier_type(self) -> str:
+        return self._barrier_type
+
+    @abstractmethod
+    def _vanilla_payoff(self, s: np.ndarray) -> np.ndarray:
+        pass
+
+    def survival_factor(self, s_prev: np.ndarray, s_next: np.ndarray, dt: float) -> np.ndarray:
+        """
+        Probability that the underlying does not cross the barrier between two grid points.
+
+        Conditionally on its end points, the log price is a Brownian bridge, which crosses
+        the barrier with probability exp(-2 log(B / S_i) log(B / S_{i+1}) / (vol^2 dt)).
+
+        Parameters
+        ----------
+        s_prev : np.ndarray
+            Asset prices at the start of the time step.
+        s_next : np.ndarray
+            Asset prices at the end of the time step.
+        dt : float
+            Length of the time step.
+
+        Returns
+        -------
+        np.ndarray
+            The survival probability over the time step, zero if a grid point is beyond the barrier.
+        """
+        if self._barrier_type.startswith("up"):
+            a, b = np.log(self._barrier / s_prev), np.log(self._barrier / s_next)
+        else:
+            a, b = np.log(s_prev / self._barrier), np.log(s_next / self._barrier)
+
+        alive = (a > 0) & (b > 0)
+        crossing = np.exp(-2 * np.maximum(a, 0) * np.maximum(b, 0) / (self.vol**2 * dt))
+        return np.where(alive, 1 - crossing, 0)
+
+    def running_payoff(self, states: Iterable[np.ndarray], n_steps: int) -> np.ndarray:
+        """
+        Compute the payoff from the successive asset prices S_0, ..., S_n, keeping only the
+        running survival probability and the last prices in memory.
+
+        Parameters
+        ----------
+        states : Iterable[np.ndarray]
+            The asset prices at each of the n_steps + 1 grid points.
+        n_steps : int
+            Number of time steps of the grid.
+
+        Returns
+        -------
+        np.ndarray
+            The payoff of each path.
+
+        Examples
+        --------
+        >>> simulator = PathSimulator(BlackScholes(0.03, 0.2))
+        >>> option = BarrierCall(1.0, 100.0, 120.0, 0.2, "up-and-out")
+        >>> payoffs = option.running_payoff(simulator.iterate(100.0, 1.0, 50, 100_000), 50)
+        """
+        dt = self.maturity / n_steps
+        states = iter(states)
+        s_prev = next(states)
+        survival = np.ones_like(s_prev)
+        for s in states:
+            survival *= self.survival_factor(s_prev, s, dt)
+            s_prev = s
+
+        if self._barrier_type.endswith("in"):
+            survival = 1 - survival
+        return self._vanilla_payoff(s_prev) * survival
+
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
+        paths = self._path_major(paths, layout)
+        return self.running_payoff(np.moveaxis(paths, 1, 0), paths.shape[1] - 1)
+
+
+class BarrierCall(BarrierContract):
+    """
+    A barrier call option, paying max(S_T - strike, 0) if the barrier condition is met.
+    """
+
+    def __init__(
+        self,
+        maturity: float,
+        strike: float,
+        barrier: float,
+        vol: float,
+        barrier_type: Literal["up-and-out", "up-and-in", "down-and-out", "down-and-in"],
+    ):
+        super().__init__(maturity, strike, barrier, vol, barrier_type)
+
+    def _vanilla_payoff(self, s: np.ndarray) -> np.ndarray:
+        return np.maximum(s - self.strike, 0)
+
+    @property
+    def name(self) -> str:
+        return f"Barrier Call ({self.barrier_type})"
+
+
+class BarrierPut(BarrierContract):
+    """
+    A barrier put option, paying max(strike - S_T, 0) if the barrier condition is met.
+    """
+
+    def __init__(
+        self,
+        maturity: float,
+        strike: float,
+        barrier: float,
+        vol: float,
+        barrier_type: Literal["up-and-out", "up-and-in", "down-and-out", "down-and-in"],
+    ):
+        super().__init__(maturity, strike, barrier, vol, barrier_type)
+
+    def _vanilla_payoff(self, s: np.ndarray) -> np.ndarray:
+        return np.maximum(self.strike - s, 0)
+
+    @property
+    def name(self) -> str:
+        return f"Barrier Put ({self.barrier_type})"
@@ -1,12 +1,47 @@
+from ..instrumentation import count, get_stats, timer
+
 import numpy as np
 
+import functools
+import threading
+
 from abc import ABC, abstractmethod
+from typing import Literal
+
+
+# Set while an instrumented payoff runs, so that payoffs calling `super().payoff` are recorded once.
+_in_payoff = threading.local()
 
 
 class Contract(ABC):
     def __init__(self, maturity: float):
         self._maturity = maturity
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        payoff = cls.__dict__.get("payoff")
+        if payoff is None or getattr(payoff, "__isabstractmethod__", False) or hasattr(payoff, "__instrumented__"):
+            return
+
+        # Time every concrete payoff when instrumentation is enabled, under the class of the
+        # contract priced and only in the outermost payoff call.
+        @functools.wraps(payoff)
+        def instrumented_payoff(self, paths: np.ndarray, **kwargs) -> np.ndarray:
+            if get_stats() is None or getattr(_in_payoff, "active", False):
+                return payoff(self, paths, **kwargs)
+            name = type(self).__name__
+            n_paths = paths.shape[1] if kwargs.get("layout") == "time_major" else paths.shape[0]
+            count(f"payoff.{name}.paths", n_paths)
+            _in_payoff.active = True
+            try:
+                with timer(f"payoff.{name}"):
+                    return payoff(self, paths, **kwargs)
+            finally:
+                _in_payoff.active = False
+
+        instrumented_payoff.__instrumented__ = True
+        cls.payoff = instrumented_payoff
+
     @property
     def maturity(self) -> float:
         return self._maturity
@@ -17,5 +52,22 @@ class Contract(ABC):
         pass
 
     @abstractmethod
-    def payoff(self, paths: np.ndarray) -> np.ndarray:
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
         pass
+
+    @staticmethod
+    def _path_major(paths: np.ndarray, layout: Literal["path_major", "time_major"]) -> np.ndarray:
+        """
+        Return a path-major view of `paths`, of shape (n_paths, n_steps + 1, ...), without copying.
+        """
+        if layout == "path_major":
+            return paths
+        elif layout == "time_major":
+            return np.moveaxis(paths, 0, 1)
+        else:
+            raise ValueError(f"Unknown layout: {layout}")
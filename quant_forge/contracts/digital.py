@@ -8,6 +8,7 @@ from .contract import Contract
 import numpy as np
 
 from abc import abstractmethod
+from typing import Literal
 
 
 class DigitalContract(Contract):
@@ -42,7 +43,12 @@ class DigitalContract(Contract):
         return self._payout
 
     @abstractmethod
-    def payoff(self, paths: np.ndarray) -> np.ndarray:
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
         pass
 
 
@@ -54,7 +60,13 @@ class DigitalCall(DigitalContract):
     def __init__(self, maturity: float, strike: float, payout: float):
         super().__init__(maturity, strike, payout)
 
-    def payoff(self, paths: np.ndarray) -> np.ndarray:
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
+        paths = self._path_major(paths, layout)
         return self.payout * np.heaviside(paths[:, -1] - self.strike, 0)
 
     @property
@@ -70,7 +82,13 @@ class DigitalPut(DigitalContract):
     def __init__(self, maturity: float, strike: float, payout: float):
         super().__init__(maturity, strike, payout)
 
-    def payoff(self, paths: np.ndarray) -> np.ndarray:
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
+        paths = self._path_major(paths, layout)
         return self.payout * np.heaviside(self.strike - paths[:, -1], 0)
 
     @property
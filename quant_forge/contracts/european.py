@@ -8,6 +8,7 @@ from .contract import Contract
 import numpy as np
 
 from abc import abstractmethod
+from typing import Literal
 
 
 class EuropeanContract(Contract):
@@ -48,8 +49,14 @@ class EuropeanCall(EuropeanContract):
     def __init__(self, maturity: float, strike: float):
         super().__init__(maturity, strike)
 
-    def payoff(self, path: np.ndarray) -> np.ndarray:
-        return np.maximum(path[:, -1] - self.strike, 0)
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
+        paths = self._path_major(paths, layout)
+        return np.maximum(paths[:, -1] - self.strike, 0)
 
     @property
     def name(self) -> str:
@@ -68,8 +75,14 @@ class EuropeanPut(EuropeanContract):
     def __init__(self, maturity: float, strike: float):
         super().__init__(maturity, strike)
 
-    def payoff(self, path: np.ndarray) -> np.ndarray:
-        return np.maximum(self.strike - path[:, -1], 0)
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
+        paths = self._path_major(paths, layout)
+        return np.maximum(self.strike - paths[:, -1], 0)
 
     @property
     def name(self) -> str:
@@ -2,19 +2,30 @@ from .contract import Contract
 
 import numpy as np
 
+import math
+
+from typing import Literal
+
 
 class Lookback(Contract):
     def __init__(self, maturity: float, vol: float):
         super().__init__(maturity)
         self.vol = vol
 
-    def payoff(self, paths: np.ndarray) -> np.ndarray:
+    def payoff(
+        self,
+        paths: np.ndarray,
+        *,
+        layout: Literal["path_major", "time_major"] = "path_major",
+    ) -> np.ndarray:
         """
         See https://people.maths.ox.ac.uk/gilesm/files/OPRE_2008.pdf
         """
+        paths = self._path_major(paths, layout)
         beta = 0.5826
         dt = self.maturity / (paths.shape[1] - 1)
-        correction = 1.0 - beta * self.vol * np.sqrt(dt)
+        # A Python float keeps the payoff in the dtype of the paths.
+        correction = 1.0 - beta * self.vol * math.sqrt(dt)
         return paths[:, -1] - np.min(paths, axis=1) * correction
 
     @property
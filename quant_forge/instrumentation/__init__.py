@@ -0,0 +1,18 @@
+from .stats import Stats, TimerStat, enable, disable, get_stats, instrument, timer, count
+from .export import to_prometheus, to_opentelemetry, write_prometheus, write_opentelemetry
+
+__all__ = [
+    "Stats",
+    "TimerStat",
+    "enable",
+    "disable",
+    "get_stats",
+    "instrument",
+    "timer",
+    "count",
+] + [
+    "to_prometheus",
+    "to_opentelemetry",
+    "write_prometheus",
+    "write_opentelemetry",
+]
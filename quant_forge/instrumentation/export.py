@@ -0,0 +1,103 @@
+"""
+Exports of collected `Stats` in the Prometheus text exposition format and as
+OpenTelemetry (OTLP/JSON) metrics, written to local files.
+"""
+
+from .stats import Stats
+
+import json
+import os
+import re
+import time
+
+from typing import Union
+
+PathLike = Union[str, os.PathLike]
+
+
+def _metric_name(prefix: str, name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", f"{prefix}_{name}")
+
+
+def to_prometheus(stats: Stats, prefix: str = "quant_forge") -> str:
+    """
+    Render `stats` in the Prometheus text exposition format.
+
+    Counters are exported as ``<name>_total`` counters and timers as summaries
+    with ``_count`` and ``_sum`` samples in seconds.
+    """
+    snapshot = stats.as_dict()
+    lines = []
+    for name, value in sorted(snapshot["counters"].items()):
+        metric = _metric_name(prefix, name) + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value:g}")
+    for name, timer in sorted(snapshot["timers"].items()):
+        metric = _metric_name(prefix, name) + "_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        lines.append(f"{metric}_count {timer['count']}")
+        lines.append(f"{metric}_sum {timer['total']!r}")
+    return "\n".join(lines) + "\n"
+
+
+def to_opentelemetry(stats: Stats, service_name: str = "quant_forge") -> dict:
+    """
+    Render `stats` as an OTLP/JSON ``ExportMetricsServiceRequest``.
+
+    Counters are exported as monotonic cumulative sums and timers as summaries in seconds.
+    """
+    snapshot = stats.as_dict()
+    now = str(time.time_ns())
+    metrics = []
+    for name, value in sorted(snapshot["counters"].items()):
+        metrics.append(
+            {
+                "name": name,
+                "sum": {
+                    "dataPoints": [{"asDouble": float(value), "timeUnixNano": now}],
+                    "aggregationTemporality": 2,
+                    "isMonotonic": True,
+                },
+            }
+        )
+    for name, timer in sorted(snapshot["timers"].items()):
+        metrics.append(
+            {
+                "name": name,
+                "unit": "s",
+                "summary": {
+                    "dataPoints": [
+                        {
+                            "count": str(timer["count"]),
+                            "sum": timer["total"],
+                            "quantileValues": [{"quantile": 1.0, "value": timer["max"]}],
+                            "timeUnixNano": now,
+                        }
+                    ]
+                },
+            }
+        )
+    return {
+        "resourceMetrics": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+                "scopeMetrics": [{"scope": {"name": "quant_forge.instrumentation"}, "metrics": metrics}],
+            }
+        ]
+    }
+
+
+def write_prometheus(stats: Stats, path: PathLike, prefix: str = "quant_forge") -> None:
+    """
+    Write `stats` to `path` in the Prometheus text format, e.g. for the node exporter textfile collector.
+    """
+    with open(path, "w") as f:
+        f.write(to_prometheus(stats, prefix))
+
+
+def write_opentelemetry(stats: Stats, path: PathLike, service_name: str = "quant_forge") -> None:
+    """
+    Append `stats` to `path` as one OTLP/JSON line, the format of the OpenTelemetry collector file exporter.
+    """
+    with open(path, "a") as f:
+        f.write(json.dumps(to_opentelemetry(stats, service_name)) + "\n")
@@ -0,0 +1,210 @@
+"""
+Opt-in collection of timers and counters for the pricing hot paths.
+
+Instrumentation is disabled by default. While disabled, `timer` returns a shared no-op
+context manager and `count` returns immediately, so the instrumented code only pays for
+a global lookup.
+"""
+
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class TimerStat:
+    """
+    Aggregated measurements of a timed section.
+    """
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {"count": self.count, "total": self.total, "mean": self.mean, "max": self.max}
+
+    def copy(self) -> "TimerStat":
+        timer = TimerStat()
+        timer.count, timer.total, timer.max = self.count, self.total, self.max
+        return timer
+
+
+class Stats:
+    """
+    A thread-safe collection of named timers and counters.
+
+    Names are dot separated, e.g. ``"simulate.rng"`` or ``"implied_volatility.iterations"``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timers: dict[str, TimerStat] = {}
+        self._counters: dict[str, float] = {}
+
+    @property
+    def timers(self) -> dict[str, TimerStat]:
+        """
+        A snapshot of the timers, safe to read while other threads record.
+        """
+        with self._lock:
+            return {name: timer.copy() for name, timer in self._timers.items()}
+
+    @property
+    def counters(self) -> dict[str, float]:
+        """
+        A snapshot of the counters, safe to read while other threads record.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def add(self, name: str, value: float = 1) -> None:
+        """
+        Increment the counter `name` by `value`.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def record_time(self, name: str, seconds: float) -> None:
+        """
+        Add a measurement of `seconds` to the timer `name`.
+        """
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                timer = self._timers[name] = TimerStat()
+            timer.count += 1
+            timer.total += seconds
+            timer.max = max(timer.max, seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def as_dict(self) -> dict[str, dict]:
+        """
+        Return a snapshot of every timer and counter.
+        """
+        with self._lock:
+            return {
+                "timers": {name: timer.as_dict() for name, timer in self._timers.items()},
+                "counters": dict(self._counters),
+            }
+
+    def __repr__(self) -> str:
+        lines = ["Stats("]
+        with self._lock:
+            for name, timer in sorted(self._timers.items()):
+                lines.append(f"  {name}: {timer.count} calls, {timer.total:.6f}s total, {timer.mean:.6f}s mean")
+            for name, value in sorted(self._counters.items()):
+                lines.append(f"  {name}: {value:g}")
+        lines.append(")")
+        return "\n".join(lines)
+
+
+class _Timer:
+    __slots__ = ("_stats", "_name", "_start")
+
+    def __init__(self, stats: Stats, name: str):
+        self._stats = stats
+        self._name = name
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stats.record_time(self._name, time.perf_counter() - self._start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+_active: Optional[Stats] = None
+
+
+def enable(stats: Optional[Stats] = None) -> Stats:
+    """
+    Start recording into `stats`, or into a new `Stats` if none is given.
+
+    Returns
+    -------
+    Stats
+        The collection receiving the measurements.
+    """
+    global _active
+    _active = stats if stats is not None else Stats()
+    return _active
+
+
+def disable() -> None:
+    """
+    Stop recording. Previously collected stats are left untouched.
+    """
+    global _active
+    _active = None
+
+
+def get_stats() -> Optional[Stats]:
+    """
+    Return the collection currently recording, or None if instrumentation is disabled.
+    """
+    return _active
+
+
+@contextmanager
+def instrument(stats: Optional[Stats] = None) -> Iterator[Stats]:
+    """
+    Enable instrumentation for the duration of a ``with`` block.
+
+    Examples
+    --------
+    >>> with instrument() as stats:
+    ...     paths = PathSimulator(BlackScholes(0.03, 0.2)).simulate(100, 1, 100, 10_000)
+    >>> stats.counters["simulate.paths"]
+    10000
+    """
+    previous = _active
+    try:
+        yield enable(stats)
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
+
+
+def timer(name: str):
+    """
+    Return a context manager timing its block into the timer `name`.
+    """
+    stats = _active
+    if stats is None:
+        return _NULL_TIMER
+    return _Timer(stats, name)
+
+
+def count(name: str, value: float = 1) -> None:
+    """
+    Increment the counter `name` by `value` if instrumentation is enabled.
+    """
+    stats = _active
+    if stats is not None:
+        stats.add(name, value)
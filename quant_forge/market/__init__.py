@@ -1,16 +1,15 @@
-from .stock import get_stock_data
-from .options import (
-    get_options_data,
-    filter_options_data,
-    get_options_surface_data,
-    compute_implied_volatility,
-    plot_surface,
-)
+from .._lazy import attach
 
-__all__ = ["get_stock_data"] + [
-    "get_options_data",
-    "filter_options_data",
-    "get_options_surface_data",
-    "compute_implied_volatility",
-    "plot_surface",
-]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["options", "stock"],
+    exports={
+        "get_stock_data": "stock",
+        "get_options_data": "options",
+        "filter_options_data": "options",
+        "get_options_surface_data": "options",
+        "compute_implied_volatility": "options",
+        "plot_surface": "options",
+    },
+    extra="market",
+)
@@ -1,13 +1,19 @@
+from .._lazy import lazy_import
 from ..calibration.implied_volatility import implied_volatility
 
 import numpy as np
-import plotly.graph_objects as go
-from scipy.interpolate import griddata
 import pandas as pd
-import yfinance as yf
 
+from typing import TYPE_CHECKING
 
-def get_options_data(stock: yf.Ticker) -> tuple[pd.DataFrame, pd.DataFrame]:
+if TYPE_CHECKING:
+    import yfinance as yf
+
+go = lazy_import("plotly.graph_objects", extra="market")
+interpolate = lazy_import("scipy.interpolate")
+
+
+def get_options_data(stock: "yf.Ticker") -> tuple[pd.DataFrame, pd.DataFrame]:
     calls_frames = []
     puts_frames = []
 
@@ -77,7 +83,7 @@ def compute_implied_volatility(options_data: pd.DataFrame, spot_price: float, in
     options_data.reset_index(drop=True, inplace=True)
 
 
-def plot_surface(options_data: pd.DataFrame, spot_price: float) -> go.Figure:
+def plot_surface(options_data: pd.DataFrame, spot_price: float) -> "go.Figure":
     symbol = options_data["Symbol"].iloc[0]
     options_surface_data = get_options_surface_data(options_data)
 
@@ -88,7 +94,7 @@ def plot_surface(options_data: pd.DataFrame, spot_price: float) -> go.Figure:
     x = np.linspace(moneyness.min(), moneyness.max(), 30)
     y = np.linspace(time_to_maturity.min(), time_to_maturity.max(), 30)
     x, y = np.meshgrid(x, y)
-    z = griddata((moneyness, time_to_maturity), implied_volatility, (x, y), method="linear")
+    z = interpolate.griddata((moneyness, time_to_maturity), implied_volatility, (x, y), method="linear")
 
     fig = go.Figure(data=go.Surface(x=x, y=y, z=z, colorscale="Viridis", showscale=False))
     fig.update_layout(
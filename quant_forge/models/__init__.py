@@ -1,8 +1,9 @@
 from .base import BaseModel
-from .black_scholes import BlackScholes, delta, gamma, vega, theta, rho
+from .black_scholes import BlackScholes, digital_price, delta, gamma, vega, theta, rho
 
 __all__ = ["BaseModel"] + [
     "BlackScholes",
+    "digital_price",
     "delta",
     "gamma",
     "vega",
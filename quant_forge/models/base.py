@@ -5,6 +5,7 @@ used by simulation engines for numerical integration of stochastic differential
 """
 
 import numpy as np
+import numpy.typing as npt
 
 from abc import ABC, abstractmethod
 
@@ -18,6 +19,65 @@ class BaseModel(ABC):
     stochastic (diffusion) components of the asset's evolution over time.
     """
 
+    # Bounds of the model parameters used by calibration, by name. Omitted parameters are unbounded.
+    parameter_bounds: dict[str, tuple[float, float]] = {}
+
+    @property
+    def parameters(self) -> dict[str, float]:
+        """
+        The model parameters, by name, as accepted by the constructor.
+        """
+        return {}
+
+    def price(
+        self,
+        s: npt.ArrayLike,
+        strike: npt.ArrayLike,
+        time_to_maturity: npt.ArrayLike,
+        option_type: npt.ArrayLike,
+    ) -> np.ndarray:
+        """
+        Compute the closed form price of European options, vectorized over quotes.
+
+        Models without a closed form raise NotImplementedError.
+
+        Parameters
+        ----------
+        s : ArrayLike
+            Current asset price.
+        strike : ArrayLike
+            Strike prices.
+        time_to_maturity : ArrayLike
+            Times to maturity.
+        option_type : ArrayLike
+            'call' or 'put', for all the quotes or for each of them.
+
+        Returns
+        -------
+        np.ndarray
+            The option prices.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no closed form price")
+
+    def price_gradient(
+        self,
+        s: npt.ArrayLike,
+        strike: npt.ArrayLike,
+        time_to_maturity: npt.ArrayLike,
+        option_type: npt.ArrayLike,
+    ) -> dict[str, np.ndarray]:
+        """
+        Compute the derivatives of `price` with respect to each model parameter.
+
+        Models without an analytic gradient raise NotImplementedError.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The derivatives of the option prices, by parameter name.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no analytic price gradient")
+
     @abstractmethod
     def drift(self, t: float, s: np.ndarray) -> np.ndarray:
         """
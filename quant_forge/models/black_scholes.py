@@ -1,16 +1,21 @@
 from . import BaseModel
+from .._lazy import lazy_import
 
 import numpy as np
-from scipy.stats import norm
+import numpy.typing as npt
 
 from typing import Literal
 
+stats = lazy_import("scipy.stats")
+
 
 class BlackScholes(BaseModel):
     """
     Black-Scholes model for asset dynamics under constant interest rate and volatility.
     """
 
+    parameter_bounds = {"sigma": (1e-4, 5.0)}
+
     def __init__(self, interest_rate: float, sigma: float):
         self._interest_rate = interest_rate
         self._sigma = sigma
@@ -23,12 +28,55 @@ class BlackScholes(BaseModel):
     def sigma(self) -> float:
         return self._sigma
 
+    @property
+    def parameters(self) -> dict[str, float]:
+        return {"interest_rate": self._interest_rate, "sigma": self._sigma}
+
     def drift(self, t: float, s: np.ndarray) -> np.ndarray:
         return s * self._interest_rate
 
     def diffusion(self, t: float, s: np.ndarray) -> np.ndarray:
         return s * self._sigma
 
+    def price(
+        self,
+        s: npt.ArrayLike,
+        strike: npt.ArrayLike,
+        time_to_maturity: npt.ArrayLike,
+        option_type: npt.ArrayLike,
+    ) -> np.ndarray:
+        s, strike, time_to_maturity = np.asarray(s), np.asarray(strike), np.asarray(time_to_maturity)
+        is_call = call_mask(option_type)
+        call = black_scholes_price(s, strike, time_to_maturity, self._interest_rate, self._sigma, "call")
+        # Put prices from the put-call parity.
+        put = call - s + strike * np.exp(-self._interest_rate * time_to_maturity)
+        return np.where(is_call, call, put)
+
+    def price_gradient(
+        self,
+        s: npt.ArrayLike,
+        strike: npt.ArrayLike,
+        time_to_maturity: npt.ArrayLike,
+        option_type: npt.ArrayLike,
+    ) -> dict[str, np.ndarray]:
+        s, strike, time_to_maturity = np.asarray(s), np.asarray(strike), np.asarray(time_to_maturity)
+        is_call = call_mask(option_type)
+        args = (s, strike, time_to_maturity, self._interest_rate, self._sigma)
+        return {
+            "interest_rate": np.where(is_call, rho(*args, "call"), rho(*args, "put")),
+            "sigma": vega(*args),
+        }
+
+
+def call_mask(option_type: npt.ArrayLike) -> np.ndarray:
+    """
+    Boolean mask of the calls among option types, which must all be 'call' or 'put' in any case.
+    """
+    option_type = np.char.lower(np.asarray(option_type, dtype=str))
+    if not np.all((option_type == "call") | (option_type == "put")):
+        raise ValueError("option_type must be 'call' or 'put'")
+    return option_type == "call"
+
 
 def _d1_d2(s: float, strike: float, time_to_maturity: float, interest_rate: float, sigma: float) -> tuple[float, float]:
     d1 = (np.log(s / strike) + (interest_rate + 0.5 * sigma**2) * time_to_maturity) / (
@@ -52,15 +100,37 @@ def black_scholes_price(
     d1, d2 = _d1_d2(s, strike, time_to_maturity, interest_rate, sigma)
 
     if option_type.lower() == "call":
-        price = s * norm.cdf(d1) - strike * np.exp(-interest_rate * time_to_maturity) * norm.cdf(d2)
+        price = s * stats.norm.cdf(d1) - strike * np.exp(-interest_rate * time_to_maturity) * stats.norm.cdf(d2)
     elif option_type.lower() == "put":
-        price = strike * np.exp(-interest_rate * time_to_maturity) * norm.cdf(-d2) - s * norm.cdf(-d1)
+        price = strike * np.exp(-interest_rate * time_to_maturity) * stats.norm.cdf(-d2) - s * stats.norm.cdf(-d1)
     else:
         raise ValueError("option_type must be 'call' or 'put'")
 
     return price
 
 
+def digital_price(
+    s: float,
+    strike: float,
+    time_to_maturity: float,
+    interest_rate: float,
+    sigma: float,
+    option_type: Literal["call", "put"],
+    payout: float = 1.0,
+) -> float:
+    """
+    Calculate the Black-Scholes price of a cash-or-nothing digital call/put.
+    """
+    _, d2 = _d1_d2(s, strike, time_to_maturity, interest_rate, sigma)
+
+    if option_type.lower() == "call":
+        return payout * np.exp(-interest_rate * time_to_maturity) * stats.norm.cdf(d2)
+    elif option_type.lower() == "put":
+        return payout * np.exp(-interest_rate * time_to_maturity) * stats.norm.cdf(-d2)
+    else:
+        raise ValueError("option_type must be 'call' or 'put'")
+
+
 def delta(
     s: float,
     strike: float,
@@ -75,9 +145,9 @@ def delta(
     d1, _ = _d1_d2(s, strike, time_to_maturity, interest_rate, sigma)
 
     if option_type.lower() == "call":
-        return norm.cdf(d1)
+        return stats.norm.cdf(d1)
     elif option_type.lower() == "put":
-        return norm.cdf(d1) - 1.0
+        return stats.norm.cdf(d1) - 1.0
     else:
         raise ValueError("option_type must be 'call' or 'put'")
 
@@ -93,7 +163,7 @@ def gamma(
     Calculate the Gamma of a European option (same for call and put).
     """
     d1, _ = _d1_d2(s, strike, time_to_maturity, interest_rate, sigma)
-    return norm.pdf(d1) / (s * sigma * np.sqrt(time_to_maturity))
+    return stats.norm.pdf(d1) / (s * sigma * np.sqrt(time_to_maturity))
 
 
 def vega(
@@ -107,7 +177,7 @@ def vega(
     Calculate the Vega of a European option (same for call and put).
     """
     d1, _ = _d1_d2(s, strike, time_to_maturity, interest_rate, sigma)
-    return s * np.sqrt(time_to_maturity) * norm.pdf(d1)
+    return s * np.sqrt(time_to_maturity) * stats.norm.pdf(d1)
 
 
 def theta(
@@ -122,13 +192,13 @@ def theta(
     Calculate the Theta of a European call/put option.
     """
     d1, d2 = _d1_d2(s, strike, time_to_maturity, interest_rate, sigma)
-    first_term = -(s * norm.pdf(d1) * sigma) / (2 * np.sqrt(time_to_maturity))
+    first_term = -(s * stats.norm.pdf(d1) * sigma) / (2 * np.sqrt(time_to_maturity))
 
     if option_type.lower() == "call":
-        second_term = -interest_rate * strike * np.exp(-interest_rate * time_to_maturity) * norm.cdf(d2)
+        second_term = -interest_rate * strike * np.exp(-interest_rate * time_to_maturity) * stats.norm.cdf(d2)
         return first_term + second_term
     elif option_type.lower() == "put":
-        second_term = interest_rate * strike * np.exp(-interest_rate * time_to_maturity) * norm.cdf(-d2)
+        second_term = interest_rate * strike * np.exp(-interest_rate * time_to_maturity) * stats.norm.cdf(-d2)
         return first_term + second_term
     else:
         raise ValueError("option_type must be 'call' or 'put'")
@@ -148,8 +218,8 @@ def rho(
     _, d2 = _d1_d2(s, strike, time_to_maturity, interest_rate, sigma)
 
     if option_type.lower() == "call":
-        return strike * time_to_maturity * np.exp(-interest_rate * time_to_maturity) * norm.cdf(d2)
+        return strike * time_to_maturity * np.exp(-interest_rate * time_to_maturity) * stats.norm.cdf(d2)
     elif option_type.lower() == "put":
-        return -strike * time_to_maturity * np.exp(-interest_rate * time_to_maturity) * norm.cdf(-d2)
+        return -strike * time_to_maturity * np.exp(-interest_rate * time_to_maturity) * stats.norm.cdf(-d2)
     else:
         raise ValueError("option_type must be 'call' or 'put'")
@@ -0,0 +1,7 @@
+from .scenarios import Position, ScenarioResult, revalue_scenarios
+
+__all__ = [
+    "Position",
+    "ScenarioResult",
+    "revalue_scenarios",
+]
@@ -0,0 +1,344 @@
+"""
+Implements scenario-grid revaluation of a book of positions under spot and volatility shocks.
+Every position is revalued on the whole grid in one broadcasted computation, using the
+Black-Scholes closed form where available and Monte Carlo paths shared across positions
+and scenarios otherwise.
+"""
+
+from ..contracts import Contract, DigitalCall, DigitalPut, EuropeanCall, EuropeanPut
+from ..models import BlackScholes
+from ..models.black_scholes import black_scholes_price, digital_price
+from ..simulations import PathSimulator
+
+import numpy as np
+import numpy.typing as npt
+
+import copy
+
+from typing import Optional
+
+# Target size of the stacked paths of all the spot shocks of a chunk, small enough to stay in cache.
+STACKED_PATHS_BYTES = 8 * 2**20
+
+# Contracts revalued with a closed form under Black-Scholes. Subclasses may override the payoff,
+# and are revalued by Monte Carlo.
+CLOSED_FORM_CONTRACTS = (EuropeanCall, EuropeanPut, DigitalCall, DigitalPut)
+
+
+class Position:
+    """
+    A quantity of a contract on an underlying with given spot price and volatility.
+    """
+
+    def __init__(self, contract: Contract, quantity: float = 1.0, *, spot: float, sigma: float):
+        """
+        Initialize a position.
+
+        Parameters
+        ----------
+        contract : Contract
+            The contract held.
+        quantity : float, optional
+            Number of contracts held, negative for a short position, by default 1.
+        spot : float
+            Current price of the underlying.
+        sigma : float
+            Current volatility of the underlying.
+        """
+        self._contract = contract
+        self._quantity = quantity
+        self._spot = spot
+        self._sigma = sigma
+
+    @property
+    def contract(self) -> Contract:
+        return self._contract
+
+    @property
+    def quantity(self) -> float:
+        return self._quantity
+
+    @property
+    def spot(self) -> float:
+        return self._spot
+
+    @property
+    def sigma(self) -> float:
+        return self._sigma
+
+
+class ScenarioResult:
+    """
+    Values and P&L of a book of positions over a grid of spot and volatility shocks.
+    """
+
+    def __init__(
+        self,
+        base_values: np.ndarray,
+        values: np.ndarray,
+        spot_values: np.ndarray,
+        vol_values: np.ndarray,
+        spot_shocks: np.ndarray,
+        vol_shocks: np.ndarray,
+    ):
+        self._base_values = base_values
+        self._values = values
+        self._spot_values = spot_values
+        self._vol_values = vol_values
+        self._spot_shocks = spot_shocks
+        self._vol_shocks = vol_shocks
+
+    @property
+    def base_values(self) -> np.ndarray:
+        """
+        Value of each position in the unshocked scenario, of shape (n_positions,).
+        """
+        return self._base_values
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Value of each position in each scenario, of shape (n_positions, n_spot_shocks, n_vol_shocks).
+        """
+        return self._values
+
+    @property
+    def spot_values(self) -> np.ndarray:
+        """
+        Value of each position under each spot shock alone, of shape (n_positions, n_spot_shocks).
+        """
+        return self._spot_values
+
+    @property
+    def vol_values(self) -> np.ndarray:
+        """
+        Value of each position under each volatility shock alone, of shape (n_positions, n_vol_shocks).
+        """
+        return self._vol_values
+
+    @property
+    def spot_shocks(self) -> np.ndarray:
+        return self._spot_shocks
+
+    @property
+    def vol_shocks(self) -> np.ndarray:
+        return self._vol_shocks
+
+    @property
+    def pnl(self) -> np.ndarray:
+        """
+        P&L cube of each position, of shape (n_positions, n_spot_shocks, n_vol_shocks).
+        """
+        return self._values - self._base_values[:, None, None]
+
+    @property
+    def portfolio_pnl(self) -> np.ndarray:
+        """
+        P&L of the whole book, of shape (n_spot_shocks, n_vol_shocks).
+        """
+        return self.pnl.sum(axis=0)
+
+    def spot_ladder(self) -> np.ndarray:
+        """
+        Book P&L for each spot shock, with unshocked volatilities.
+        """
+        return (self._spot_values - self._base_values[:, None]).sum(axis=0)
+
+    def vol_ladder(self) -> np.ndarray:
+        """
+        Book P&L for each volatility shock, with unshocked spots.
+        """
+        return (self._vol_values - self._base_values[:, None]).sum(axis=0)
+
+
+def _closed_form_values(
+    contracts: list[Contract],
+    spot: np.ndarray,
+    sigma: np.ndarray,
+    interest_rate: float,
+) -> np.ndarray:
+    """
+    Unit values of closed form contracts, broadcasting `spot` and `sigma` of shape
+    (n_contracts, n_spot, 1) and (n_contracts, 1, n_vol).
+    """
+    strike = np.array([c.strike for c in contracts])[:, None, None]
+    maturity = np.array([c.maturity for c in contracts])[:, None, None]
+    values = np.empty(np.broadcast_shapes(spot.shape, sigma.shape))
+
+    for contract_type, option_type in [(EuropeanCall, "call"), (EuropeanPut, "put")]:
+        mask = np.array([type(c) is contract_type for c in contracts])
+        if mask.any():
+            values[mask] = black_scholes_price(
+                spot[mask], strike[mask], maturity[mask], interest_rate, sigma[mask], option_type
+            )
+
+    for contract_type, option_type in [(DigitalCall, "call"), (DigitalPut, "put")]:
+        mask = np.array([type(c) is contract_type for c in contracts])
+        if mask.any():
+            payout = np.array([c.payout for c, m in zip(contracts, mask) if m])[:, None, None]
+            values[mask] = digital_price(
+                spot[mask], strike[mask], maturity[mask], interest_rate, sigma[mask], option_type, payout
+            )
+
+    return values
+
+
+def _with_vol(contract: Contract, vol: float) -> Contract:
+    """
+    The contract with the volatility of the scenario, for contracts whose payoff depends on
+    the volatility of the underlying, such as the lookback and barrier corrections.
+    """
+    if not hasattr(contract, "vol"):
+        return contract
+    contract = copy.copy(contract)
+    contract.vol = vol
+    return contract
+
+
+def _monte_carlo_values(
+    contracts: list[Contract],
+    spot: np.ndarray,
+    sigma: np.ndarray,
+    spot_multipliers: np.ndarray,
+    vol_shocks: np.ndarray,
+    interest_rate: float,
+    n_paths: int,
+    n_steps: int,
+    path_chunk_size: int,
+    seed: Optional[int],
+) -> np.ndarray:
+    """
+    Unit values of contracts without closed form, of shape (n_contracts, n_spot, n_vol).
+
+    The Brownian increments of each chunk of paths are drawn once, and every volatility level
+    is simulated from them, so that the scenario P&L is not polluted by Monte Carlo noise.
+    Paths are simulated from unit spot and scaled to every spot shock of a position at once,
+    in a stacked array of n_spot * path_chunk_size paths evaluated in a single payoff call.
+    Contracts with a `vol` of their own are revalued with the volatility of the simulated paths.
+    """
+    n_spot = len(spot_multipliers)
+    values = np.zeros((len(contracts), n_spot, len(vol_shocks)))
+    seeds = np.random.SeedSequence(seed).spawn((n_paths + path_chunk_size - 1) // path_chunk_size)
+
+    # Group the contracts simulated with the same maturity and base volatility.
+    groups: dict[tuple[float, float], list[int]] = {}
+    for i, contract in enumerate(contracts):
+        groups.setdefault((contract.maturity, sigma[i]), []).append(i)
+
+    for (maturity, base_sigma), indices in groups.items():
+        for chunk, chunk_seed in enumerate(seeds):
+            size = min(path_chunk_size, n_paths - chunk * path_chunk_size)
+            dw = np.random.default_rng(chunk_seed).standard_normal((size, n_steps, 1))
+            dw *= np.sqrt(maturity / n_steps)
+            stacked = np.empty((n_spot, size, n_steps + 1, 1))
+
+            for k, vol_shock in enumerate(vol_shocks):
+                model = BlackScholes(interest_rate, base_sigma + vol_shock)
+                unit_paths = PathSimulator(model).simulate(1.0, maturity, n_steps, size, scheme="exact", increments=dw)
+                for i in indices:
+                    contract = _with_vol(contracts[i], base_sigma + vol_shock)
+                    np.multiply((spot[i] * spot_multipliers)[:, None, None, None], unit_paths, out=stacked)
+                    payoff = contract.payoff(stacked.reshape(n_spot * size, n_steps + 1, 1))
+                    values[i, :, k] += payoff.reshape(n_spot, size).sum(axis=1)
+
+        values[indices] *= np.exp(-interest_rate * maturity) / n_paths
+
+    return values
+
+
+def revalue_scenarios(
+    positions: list[Position],
+    spot_shocks: npt.ArrayLike,
+    vol_shocks: npt.ArrayLike,
+    interest_rate: float,
+    *,
+    n_paths: int = 10_000,
+    n_steps: int = 100,
+    chunk_size: Optional[int] = None,
+    path_chunk_size: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> ScenarioResult:
+    """
+    Revalue a book of positions over a grid of spot and volatility shocks.
+
+    European and digital contracts are revalued with the Black-Scholes closed form in one
+    broadcasted computation. Other contracts are revalued by Monte Carlo, on paths shared
+    across positions and scenarios.
+
+    Parameters
+    ----------
+    positions : list[Position]
+        The book to revalue.
+    spot_shocks : ArrayLike
+        Relative spot shocks, e.g. -0.1 for a 10% fall of every underlying.
+    vol_shocks : ArrayLike
+        Absolute volatility shocks, e.g. 0.05 for +5 volatility points.
+    interest_rate : float
+        Risk-free interest rate.
+    n_paths : int, optional
+        Number of Monte Carlo paths, by default 10 000.
+    n_steps : int, optional
+        Number of time steps of the Monte Carlo paths, by default 100.
+    chunk_size : int, optional
+        Number of positions revalued at once in closed form, by default all of them.
+    path_chunk_size : int, optional
+        Number of Monte Carlo paths simulated at once. Every spot shock of a position is evaluated
+        on a stacked copy of the chunk, so about (n_spot_shocks + 1) * path_chunk_size paths are
+        held in memory. By default, chunks are sized so that the stacked paths take about 8MB.
+    seed : int, optional
+        Seed of the Monte Carlo paths.
+
+    Returns
+    -------
+    ScenarioResult
+        The base values, the values and P&L cubes and the aggregated ladders.
+    """
+    spot_shocks = np.asarray(spot_shocks, dtype=float)
+    vol_shocks = np.asarray(vol_shocks, dtype=float)
+
+    # The first spot and volatility scenario is the unshocked one, revalued with the same
+    # paths as the shocked scenarios.
+    spot_multipliers = np.concatenate([[1.0], 1.0 + spot_shocks])
+    all_vol_shocks = np.concatenate([[0.0], vol_shocks])
+
+    contracts = [p.contract for p in positions]
+    spot = np.array([p.spot for p in positions], dtype=float)
+    sigma = np.array([p.sigma for p in positions], dtype=float)
+    quantity = np.array([p.quantity for p in positions], dtype=float)
+
+    if np.any(sigma[:, None] + all_vol_shocks[None, :] <= 0):
+        raise ValueError("Volatility shocks must keep every volatility positive")
+
+    values = np.empty((len(positions), len(spot_multipliers), len(all_vol_shocks)))
+    closed_form = np.array([type(c) in CLOSED_FORM_CONTRACTS for c in contracts], dtype=bool)
+
+    indices = np.flatnonzero(closed_form)
+    step = chunk_size or max(len(indices), 1)
+    for start in range(0, len(indices), step):
+        chunk = indices[start : start + step]
+        values[chunk] = _closed_form_values(
+            [contracts[i] for i in chunk],
+            spot[chunk, None, None] * spot_multipliers[None, :, None],
+            sigma[chunk, None, None] + all_vol_shocks[None, None, :],
+            interest_rate,
+        )
+
+    indices = np.flatnonzero(~closed_form)
+    if len(indices) > 0:
+        values[indices] = _monte_carlo_values(
+            [contracts[i] for i in indices],
+            spot[indices],
+            sigma[indices],
+            spot_multipliers,
+            all_vol_shocks,
+            interest_rate,
+            n_paths,
+            n_steps,
+            path_chunk_size or max(1, STACKED_PATHS_BYTES // (8 * (n_steps + 1) * len(spot_multipliers))),
+            seed,
+        )
+
+    values *= quantity[:, None, None]
+    return ScenarioResult(
+        values[:, 0, 0], values[:, 1:, 1:], values[:, 1:, 0], values[:, 0, 1:], spot_shocks, vol_shocks
+    )
@@ -0,0 +1,12 @@
+from .._lazy import attach
+
+# The client does not import the pricing stack, so that jobs sending requests stay light.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["client", "server", "tasks"],
+    exports={
+        "PricingClient": "client",
+        "PricingServer": "server",
+        "serve": "server",
+    },
+)
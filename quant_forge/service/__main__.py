@@ -0,0 +1,18 @@
+from .server import serve
+
+import argparse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local quant-forge pricing server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--batch-window", type=float, default=0.002, help="coalescing window in seconds")
+    args = parser.parse_args()
+
+    serve(args.host, args.port, n_workers=args.workers, batch_window=args.batch_window)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Provides a client for the local pricing server.
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+from typing import Union
+
+
+class PricingClient:
+    """
+    A client of a `PricingServer`, sending JSON requests over HTTP.
+    """
+
+    def __init__(self, url: str, timeout: float = 60.0):
+        """
+        Initialize the client.
+
+        Parameters
+        ----------
+        url : str
+            Base URL of the server, e.g. "http://127.0.0.1:8765".
+        timeout : float, optional
+            Timeout of each request in seconds, by default 60.
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def request(self, kind: str, payload: Union[dict, list[dict]]) -> Union[dict, list[dict]]:
+        """
+        Send one request, or a list of requests, of the given kind.
+
+        Raises
+        ------
+        ValueError
+            If the server rejects the request.
+        """
+        request = urllib.request.Request(
+            f"{self.url}/{kind}",
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            raise ValueError(json.loads(e.read()).get("error", str(e))) from e
+
+    def price(self, **fields) -> dict:
+        """
+        Black-Scholes prices, see `tasks.price`.
+        """
+        return self.request("price", fields)
+
+    def greeks(self, **fields) -> dict:
+        """
+        Black-Scholes Greeks, see `tasks.greeks`.
+        """
+        return self.request("greeks", fields)
+
+    def implied_volatility(self, **fields) -> dict:
+        """
+        Implied volatilities, see `tasks.implied_volatilities`.
+        """
+        return self.request("implied_volatility", fields)
+
+    def monte_carlo(self, **fields) -> dict:
+        """
+        Monte Carlo price of a contract, see `tasks.monte_carlo`.
+        """
+        return self.request("monte_carlo", fields)
+
+    def metrics(self) -> dict:
+        """
+        Latency and throughput metrics of the server.
+        """
+        with urllib.request.urlopen(f"{self.url}/metrics", timeout=self.timeout) as response:
+            return json.loads(response.read())
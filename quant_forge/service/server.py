@@ -0,0 +1,301 @@
+"""
+Implements a long-running local pricing server. It answers JSON requests over localhost HTTP
+with a pool of warm worker processes, and coalesces concurrent small requests of the same
+kind into a single vectorized call.
+"""
+
+from ..instrumentation import Stats, to_prometheus
+from . import tasks
+
+import numpy as np
+
+import json
+import os
+import queue
+import threading
+import time
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+def _merge(batches: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    """
+    Concatenate the prepared batches of quotes of several requests.
+    """
+    return {field: np.concatenate([batch[field] for batch in batches]) for field in batches[0]}
+
+
+def _split(result: dict[str, np.ndarray], sizes: list[int]) -> list[dict[str, list]]:
+    """
+    Split the result of a merged batch into one JSON serializable response per request.
+    """
+    offsets = np.cumsum([0] + sizes)
+    responses = []
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        # NaN is not valid JSON, failed computations are returned as null.
+        responses.append(
+            {name: [None if np.isnan(v) else float(v) for v in values[start:stop]] for name, values in result.items()}
+        )
+    return responses
+
+
+class _Coalescer:
+    """
+    Collects the requests of one kind arriving within a short window and prices them together.
+    """
+
+    def __init__(self, kind: str, executor: ProcessPoolExecutor, stats: Stats, window: float, max_batch_size: int):
+        self._kind = kind
+        self._executor = executor
+        self._stats = stats
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"coalescer-{kind}", daemon=True)
+        self._thread.start()
+
+    def submit(self, request: dict) -> Future:
+        """
+        Queue a request, raising ValueError at once if it is invalid, so that it never fails
+        the valid requests it would be coalesced with.
+        """
+        batch = tasks.prepare(self._kind, request)
+        future: Future = Future()
+        self._queue.put((batch, future))
+        return future
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            n_quotes = len(item[0]["s"])
+            deadline = time.perf_counter() + self._window
+            while n_quotes < self._max_batch_size:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+                n_quotes += len(item[0]["s"])
+
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[tuple[dict[str, np.ndarray], Future]]) -> None:
+        batches, futures = zip(*batch)
+        sizes = [len(b["s"]) for b in batches]
+        self._stats.add(f"service.{self._kind}.batches")
+        self._stats.add(f"service.{self._kind}.quotes", sum(sizes))
+
+        def done(result: Future) -> None:
+            try:
+                responses = _split(result.result(), sizes)
+            except Exception as e:
+                if len(batch) == 1:
+                    futures[0].set_exception(e)
+                    return
+                # Retry the requests one by one, so that an error only fails the request causing it.
+                for item in batch:
+                    self._dispatch([item])
+                return
+            for future, response in zip(futures, responses):
+                future.set_result(response)
+
+        try:
+            self._executor.submit(tasks.run, self._kind, _merge(list(batches))).add_done_callback(done)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+
+
+class PricingServer:
+    """
+    A local pricing server over HTTP, backed by a pool of warm worker processes.
+
+    Requests are JSON objects POSTed to `/price`, `/greeks`, `/implied_volatility` or
+    `/monte_carlo`, or JSON lists of such objects. The fields of the elementwise requests
+    are scalars or lists, see `tasks.FIELDS`. Latency and throughput metrics are served on
+    `GET /metrics`, as JSON or in the Prometheus text format with `?format=prometheus`.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        n_workers: Optional[int] = None,
+        batch_window: float = 0.002,
+        max_batch_size: int = 100_000,
+    ):
+        """
+        Start the worker processes and bind the server, without serving requests yet.
+
+        Parameters
+        ----------
+        host : str, optional
+            Address to listen on, by default the loopback interface.
+        port : int, optional
+            Port to listen on, by default any free port.
+        n_workers : int, optional
+            Number of worker processes, by default the number of CPUs.
+        batch_window : float, optional
+            Time in seconds during which concurrent requests are coalesced, by default 2ms.
+        max_batch_size : int, optional
+            Number of quotes after which a batch is dispatched without waiting, by default 100 000.
+        """
+        self.stats = Stats()
+        self._started = time.perf_counter()
+        self._executor = ProcessPoolExecutor(max_workers=n_workers, initializer=tasks.warm_up)
+        # Start the workers now, so that they are warm when the first request arrives.
+        for future in [self._executor.submit(os.getpid) for _ in range(n_workers or os.cpu_count() or 1)]:
+            future.result()
+        self._coalescers = {
+            kind: _Coalescer(kind, self._executor, self.stats, batch_window, max_batch_size) for kind in tasks.FIELDS
+        }
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def submit(self, kind: str, request: dict) -> Future:
+        """
+        Submit one request of the given kind, coalesced with concurrent requests if elementwise.
+        """
+        if not isinstance(request, dict):
+            raise TypeError(f"A request must be a JSON object, got {type(request).__name__}")
+        if kind in self._coalescers:
+            return self._coalescers[kind].submit(request)
+        elif kind in tasks.TASKS:
+            return self._executor.submit(tasks.run, kind, request)
+        else:
+            raise ValueError(f"Unknown request kind: {kind}")
+
+    def metrics(self) -> dict:
+        """
+        Request counts, latencies and throughput since the server started.
+        """
+        snapshot = self.stats.as_dict()
+        uptime = time.perf_counter() - self._started
+        throughput = {
+            name.split(".")[1]: timer["count"] / uptime
+            for name, timer in snapshot["timers"].items()
+            if name.endswith(".latency")
+        }
+        return {**snapshot, "uptime": uptime, "requests_per_second": throughput}
+
+    def serve_forever(self) -> None:
+        """
+        Serve requests in the calling thread until `shutdown` is called.
+        """
+        self._httpd.serve_forever()
+
+    def start(self) -> "PricingServer":
+        """
+        Serve requests in a background thread.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name="pricing-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """
+        Stop serving, and shut the coalescers and the worker processes down.
+        """
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+        self._httpd.server_close()
+        for coalescer in self._coalescers.values():
+            coalescer.close()
+        self._executor.shutdown()
+
+    def __enter__(self) -> "PricingServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+            def _reply(self, status: int, body: str, content_type: str = "application/json") -> None:
+                data = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                if self.path == "/metrics":
+                    self._reply(200, json.dumps(server.metrics()))
+                elif self.path == "/metrics?format=prometheus":
+                    self._reply(200, to_prometheus(server.stats), "text/plain; version=0.0.4")
+                else:
+                    self._reply(404, json.dumps({"error": f"Unknown path: {self.path}"}))
+
+            def do_POST(self) -> None:
+                kind = self.path.strip("/")
+                start = time.perf_counter()
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                # Unknown paths are rejected before recording any metric, to keep metric names bounded.
+                if kind not in tasks.TASKS:
+                    self._reply(404, json.dumps({"error": f"Unknown path: {self.path}"}))
+                    return
+
+                try:
+                    payload = json.loads(body)
+                    requests = payload if isinstance(payload, list) else [payload]
+                    futures = [server.submit(kind, request) for request in requests]
+                    responses = [future.result() for future in futures]
+                except (ValueError, KeyError, TypeError) as e:
+                    server.stats.add(f"service.{kind}.errors")
+                    self._reply(400, json.dumps({"error": str(e)}))
+                    return
+                except Exception as e:
+                    server.stats.add(f"service.{kind}.errors")
+                    self._reply(500, json.dumps({"error": repr(e)}))
+                    return
+
+                server.stats.record_time(f"service.{kind}.latency", time.perf_counter() - start)
+                server.stats.add(f"service.{kind}.requests", len(requests))
+                self._reply(200, json.dumps(responses if isinstance(payload, list) else responses[0]))
+
+        return Handler
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, **kwargs) -> None:
+    """
+    Run a pricing server in the calling thread until interrupted.
+    """
+    server = PricingServer(host, port, **kwargs)
+    print(f"Serving on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
@@ -0,0 +1,180 @@
+"""
+Pricing tasks run by the workers of the pricing service. Elementwise tasks take a batch of
+quotes as a dict of equal length arrays, so that concurrent requests can be concatenated and
+priced in a single vectorized call.
+"""
+
+from ..calibration import implied_volatilities as solve_implied_volatilities
+from ..contracts import (
+    AsianCall,
+    AsianPut,
+    BarrierCall,
+    BarrierPut,
+    Contract,
+    DigitalCall,
+    DigitalPut,
+    EuropeanCall,
+    EuropeanPut,
+    Lookback,
+)
+from ..models import BlackScholes
+from ..models import black_scholes as bs
+from ..simulations import PathSimulator
+
+import numpy as np
+
+# Fields of the elementwise tasks, broadcast and concatenated across coalesced requests.
+FIELDS = {
+    "price": ["s", "strike", "time_to_maturity", "interest_rate", "sigma", "option_type"],
+    "greeks": ["s", "strike", "time_to_maturity", "interest_rate", "sigma", "option_type"],
+    "implied_volatility": ["market_price", "s", "strike", "time_to_maturity", "interest_rate", "option_type"],
+}
+
+CONTRACTS: dict[str, type[Contract]] = {
+    contract_type.__name__: contract_type
+    for contract_type in [
+        AsianCall,
+        AsianPut,
+        BarrierCall,
+        BarrierPut,
+        DigitalCall,
+        DigitalPut,
+        EuropeanCall,
+        EuropeanPut,
+        Lookback,
+    ]
+}
+
+
+def prepare(kind: str, request: dict) -> dict[str, np.ndarray]:
+    """
+    Validate an elementwise request and broadcast its fields to its number of quotes.
+    """
+    fields = FIELDS[kind]
+    missing = [field for field in fields if field not in request]
+    if missing:
+        raise ValueError(f"Missing fields: {missing}")
+
+    try:
+        dtypes = [str if field == "option_type" else float for field in fields]
+        columns = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(request[field], dtype=dtype)) for field, dtype in zip(fields, dtypes))
+        )
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid {kind} request: {e}") from None
+    if columns[0].ndim != 1:
+        raise ValueError("Fields must be scalars or lists")
+
+    batch = dict(zip(fields, columns))
+    bs.call_mask(batch["option_type"])
+    return batch
+
+
+def _by_option_type(function, batch: dict[str, np.ndarray], is_call: np.ndarray) -> np.ndarray:
+    args = (batch["s"], batch["strike"], batch["time_to_maturity"], batch["interest_rate"], batch["sigma"])
+    return np.where(is_call, function(*args, "call"), function(*args, "put"))
+
+
+def price(batch: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    Black-Scholes prices of a batch of European options.
+    """
+    is_call = bs.call_mask(batch["option_type"])
+    return {"price": _by_option_type(bs.black_scholes_price, batch, is_call)}
+
+
+def greeks(batch: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    Black-Scholes Greeks of a batch of European options.
+    """
+    is_call = bs.call_mask(batch["option_type"])
+    args = (batch["s"], batch["strike"], batch["time_to_maturity"], batch["interest_rate"], batch["sigma"])
+    return {
+        "delta": _by_option_type(bs.delta, batch, is_call),
+        "gamma": bs.gamma(*args),
+        "vega": bs.vega(*args),
+        "theta": _by_option_type(bs.theta, batch, is_call),
+        "rho": _by_option_type(bs.rho, batch, is_call),
+    }
+
+
+def implied_volatilities(batch: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    Implied volatilities of a batch of European option prices, NaN where the inversion fails.
+    """
+    ivs = solve_implied_volatilities(
+        batch["market_price"],
+        batch["s"],
+        batch["strike"],
+        batch["time_to_maturity"],
+        batch["interest_rate"],
+        batch["option_type"],
+    )
+    return {"implied_volatility": ivs}
+
+
+def monte_carlo(request: dict) -> dict[str, float]:
+    """
+    Monte Carlo price of a contract under the Black-Scholes model.
+
+    The request holds the `contract` class name and its constructor `contract_args`, the
+    model parameters `s0`, `interest_rate` and `sigma`, and optionally `n_steps`, `n_paths`,
+    `scheme` and `seed`.
+    """
+    if request.get("contract") not in CONTRACTS:
+        raise ValueError(f"Unknown contract: {request.get('contract')}")
+
+    contract = CONTRACTS[request["contract"]](**request.get("contract_args", {}))
+    model = BlackScholes(request["interest_rate"], request["sigma"])
+    paths = PathSimulator(model).simulate(
+        request["s0"],
+        contract.maturity,
+        int(request.get("n_steps", 100)),
+        int(request.get("n_paths", 10_000)),
+        scheme=request.get("scheme", "exact"),
+        rng=np.random.default_rng(request.get("seed")),
+    )
+    payoffs = np.exp(-request["interest_rate"] * contract.maturity) * contract.payoff(paths).ravel()
+    return {"price": float(np.mean(payoffs)), "std_error": float(np.std(payoffs) / np.sqrt(len(payoffs)))}
+
+
+TASKS = {
+    "price": price,
+    "greeks": greeks,
+    "implied_volatility": implied_volatilities,
+    "monte_carlo": monte_carlo,
+}
+
+
+def run(kind: str, payload):
+    """
+    Run the task `kind` on `payload`, the entry point of the worker processes.
+    """
+    return TASKS[kind](payload)
+
+
+def warm_up() -> None:
+    """
+    Import and exercise the pricing stack, so that the first request of a worker is not slow.
+    """
+    batch = {
+        "s": np.array([100.0]),
+        "strike": np.array([100.0]),
+        "time_to_maturity": np.array([1.0]),
+        "interest_rate": np.array([0.03]),
+        "sigma": np.array([0.2]),
+        "option_type": np.array(["call"]),
+    }
+    greeks(batch)
+    implied_volatilities({**batch, "market_price": price(batch)["price"]})
+    monte_carlo(
+        {
+            "contract": "EuropeanCall",
+            "contract_args": {"maturity": 1.0, "strike": 100.0},
+            "s0": 100.0,
+            "interest_rate": 0.03,
+            "sigma": 0.2,
+            "n_steps": 1,
+            "n_paths": 10,
+        }
+    )
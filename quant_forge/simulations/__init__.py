@@ -1,5 +1,12 @@
+from .mlmc import MLMCResult, MultilevelMonteCarlo
 from .path_simulator import PathSimulator
+from .path_store import PathStore
+from .rng import NormalPipeline
 
 __all__ = [
+    "MLMCResult",
+    "MultilevelMonteCarlo",
+    "NormalPipeline",
     "PathSimulator",
+    "PathStore",
 ]
@@ -0,0 +1,306 @@
+"""
+Implements the multilevel Monte Carlo (MLMC) estimator of Giles on top of the path simulator.
+See https://people.maths.ox.ac.uk/gilesm/files/OPRE_2008.pdf
+
+The expected payoff on the finest time grid is written as a telescoping sum of the expected
+payoff on the coarsest grid and of the corrections between successive grids. Each correction
+is estimated from pairs of fine and coarse paths driven by the same Brownian increments, so
+its variance decreases with the level and few samples are needed on the expensive levels.
+"""
+
+from ..contracts import Contract
+from ..models import BaseModel
+from .path_simulator import PathSimulator
+
+import numpy as np
+
+import math
+
+from typing import Literal, Optional
+
+
+class MLMCResult:
+    """
+    Result of a multilevel Monte Carlo estimation.
+    """
+
+    def __init__(
+        self,
+        price: float,
+        rmse: float,
+        n_samples: np.ndarray,
+        means: np.ndarray,
+        variances: np.ndarray,
+        costs: np.ndarray,
+        converged: bool,
+    ):
+        self._price = price
+        self._rmse = rmse
+        self._n_samples = n_samples
+        self._means = means
+        self._variances = variances
+        self._costs = costs
+        self._converged = converged
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+    @property
+    def rmse(self) -> float:
+        """
+        The target root mean square error.
+        """
+        return self._rmse
+
+    @property
+    def n_levels(self) -> int:
+        return len(self._n_samples)
+
+    @property
+    def n_samples(self) -> np.ndarray:
+        """
+        Number of samples on each level.
+        """
+        return self._n_samples
+
+    @property
+    def means(self) -> np.ndarray:
+        """
+        Estimated mean of the correction on each level.
+        """
+        return self._means
+
+    @property
+    def variances(self) -> np.ndarray:
+        """
+        Estimated variance of the correction on each level.
+        """
+        return self._variances
+
+    @property
+    def cost(self) -> float:
+        """
+        Total number of simulated time steps.
+        """
+        return float(np.sum(self._n_samples * self._costs))
+
+    @property
+    def converged(self) -> bool:
+        """
+        Whether the target RMSE was reached within the maximum number of levels.
+        """
+        return self._converged
+
+
+class MultilevelMonteCarlo:
+    """
+    A multilevel Monte Carlo engine pricing any contract under a given financial model.
+    """
+
+    def __init__(
+        self,
+        model: BaseModel,
+        *,
+        refinement: int = 2,
+        base_steps: int = 1,
+        scheme: Literal["euler", "exact"] = "euler",
+    ):
+        """
+        Initialize the engine.
+
+        Parameters
+        ----------
+        model : BaseModel
+            A financial model with defined drift and diffusion functions.
+        refinement : int, optional
+            Ratio between the number of time steps of successive levels, by default 2.
+        base_steps : int, optional
+            Number of time steps on level 0, by default 1.
+        scheme : str, optional
+            Simulation scheme to use, by default "euler"
+        """
+        self.simulator = PathSimulator(model)
+        self.refinement = refinement
+        self.base_steps = base_steps
+        self.scheme = scheme
+
+    def n_steps(self, level: int) -> int:
+        """
+        Number of time steps of the fine paths on `level`.
+        """
+        return self.base_steps * self.refinement**level
+
+    def level_cost(self, level: int) -> float:
+        """
+        Number of simulated time steps per sample on `level`, fine and coarse paths included.
+        """
+        if level == 0:
+            return self.n_steps(0)
+        return self.n_steps(level) * (1 + 1 / self.refinement)
+
+    def sample_level(
+        self,
+        contract: Contract,
+        s0: float,
+        level: int,
+        n_samples: int,
+        rng: np.random.Generator,
+        batch_size: int = 10_000,
+    ) -> tuple[float, float]:
+        """
+        Sample the correction P_l - P_{l-1} of `level`, or P_0 on level 0.
+
+        Parameters
+        ----------
+        contract : Contract
+            The contract to price.
+        s0 : float
+            Initial asset price.
+        level : int
+            The level to sample.
+        n_samples : int
+            Number of samples.
+        rng : np.random.Generator
+            Generator of the Brownian increments.
+        batch_size : int, optional
+            Number of paths simulated at once, by default 10 000.
+
+        Returns
+        -------
+        tuple[float, float]
+            The sum and the sum of squares of the samples.
+        """
+        t1 = contract.maturity
+        n_fine = self.n_steps(level)
+        dt = t1 / n_fine
+        total, total_sq = 0.0, 0.0
+
+        for start in range(0, n_samples, batch_size):
+            n_paths = min(batch_size, n_samples - start)
+            dw = rng.standard_normal((n_paths, n_fine, 1)) * math.sqrt(dt)
+            fine = self.simulator.simulate(s0, t1, n_fine, n_paths, scheme=self.scheme, increments=dw)
+            y = contract.payoff(fine).ravel()
+
+            if level > 0:
+                n_coarse = n_fine // self.refinement
+                dw_coarse = dw.reshape(n_paths, n_coarse, self.refinement, 1).sum(axis=2)
+                coarse = self.simulator.simulate(s0, t1, n_coarse, n_paths, scheme=self.scheme, increments=dw_coarse)
+                y = y - contract.payoff(coarse).ravel()
+
+            total += np.sum(y)
+            total_sq += np.sum(y**2)
+
+        return total, total_sq
+
+    def estimate(
+        self,
+        contract: Contract,
+        s0: float,
+        rmse: float,
+        *,
+        discount_factor: float = 1.0,
+        n_initial: int = 1_000,
+        min_levels: int = 2,
+        max_levels: int = 10,
+        alpha: Optional[float] = None,
+        beta: Optional[float] = None,
+        batch_size: int = 10_000,
+        rng: Optional[np.random.Generator] = None,
+    ) -> MLMCResult:
+        """
+        Estimate the discounted expected payoff of `contract` to a target root mean square error.
+
+        Levels are added until the estimated bias is below rmse / sqrt(2), and the number of
+        samples of each level is chosen to minimize the cost for a variance of rmse^2 / 2.
+
+        Parameters
+        ----------
+        contract : Contract
+            The contract to price.
+        s0 : float
+            Initial asset price.
+        rmse : float
+            Target root mean square error of the price.
+        discount_factor : float, optional
+            Factor applied to the payoffs, e.g. exp(-r T), by default 1.
+        n_initial : int, optional
+            Number of samples drawn on a new level to estimate its variance, by default 1 000.
+        min_levels : int, optional
+            Number of levels to start from, by default 2.
+        max_levels : int, optional
+            Maximum number of levels, by default 10.
+        alpha : float, optional
+            Weak convergence rate, |E[P_l - P_{l-1}]| ~ 2^(-alpha l). Estimated by regression if None.
+        beta : float, optional
+            Variance convergence rate, V[P_l - P_{l-1}] ~ 2^(-beta l). Estimated by regression if None.
+        batch_size : int, optional
+            Number of paths simulated at once, by default 10 000.
+        rng : np.random.Generator, optional
+            Generator of the Brownian increments, by default a new unseeded generator.
+
+        Returns
+        -------
+        MLMCResult
+            The price and the per-level statistics.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        n_levels = min_levels
+        n_samples = np.zeros(n_levels, dtype=np.int64)
+        sums = np.zeros((2, n_levels))
+        costs = np.array([self.level_cost(level) for level in range(n_levels)])
+        new_samples = np.full(n_levels, n_initial, dtype=np.int64)
+        converged = False
+
+        while np.sum(new_samples) > 0:
+            for level in np.flatnonzero(new_samples > 0):
+                total, total_sq = self.sample_level(contract, s0, level, int(new_samples[level]), rng, batch_size)
+                n_samples[level] += new_samples[level]
+                sums[:, level] += total * discount_factor, total_sq * discount_factor**2
+
+            means = np.abs(sums[0] / n_samples)
+            variances = np.maximum(0.0, sums[1] / n_samples - means**2)
+
+            # The corrections of the finest levels may vanish by chance, bound them by the decay rates.
+            level_alpha = alpha if alpha is not None else self._regression_rate(means)
+            level_beta = beta if beta is not None else self._regression_rate(variances)
+            decay_alpha, decay_beta = self.refinement**level_alpha, self.refinement**level_beta
+            for level in range(2, n_levels):
+                means[level] = max(means[level], 0.5 * means[level - 1] / decay_alpha)
+                variances[level] = max(variances[level], 0.5 * variances[level - 1] / decay_beta)
+
+            optimal = np.ceil(2 * np.sqrt(variances / costs) * np.sum(np.sqrt(variances * costs)) / rmse**2)
+            new_samples = np.maximum(0, optimal - n_samples).astype(np.int64)
+
+            # Once the sample sizes settled, test the bias and add a level if needed.
+            if np.all(new_samples <= 0.01 * n_samples):
+                bias = max(means[-1 - i] / decay_alpha**i for i in range(min(3, n_levels))) / (decay_alpha - 1)
+                converged = bias <= rmse / np.sqrt(2)
+                if not converged and n_levels < max_levels:
+                    n_levels += 1
+                    variances = np.append(variances, variances[-1] / decay_beta)
+                    n_samples = np.append(n_samples, 0)
+                    sums = np.append(sums, np.zeros((2, 1)), axis=1)
+                    costs = np.append(costs, self.level_cost(n_levels - 1))
+
+                    optimal = np.ceil(
+                        2 * np.sqrt(variances / costs) * np.sum(np.sqrt(variances * costs)) / rmse**2
+                    )
+                    new_samples = np.maximum(0, optimal - n_samples).astype(np.int64)
+                    new_samples[-1] = max(new_samples[-1], n_initial)
+
+        means = sums[0] / n_samples
+        variances = np.maximum(0.0, sums[1] / n_samples - means**2)
+        return MLMCResult(float(np.sum(means)), rmse, n_samples, means, variances, costs, converged)
+
+    def _regression_rate(self, values: np.ndarray) -> float:
+        """
+        Decay rate of `values` across levels 1 and above, in powers of the refinement, at least 0.5.
+        """
+        levels = np.arange(1, len(values))
+        values = values[1:]
+        mask = values > 0
+        if np.count_nonzero(mask) < 2:
+            return 0.5
+        slope = np.polyfit(levels[mask], np.log(values[mask]) / np.log(self.refinement), 1)[0]
+        return max(0.5, -slope)
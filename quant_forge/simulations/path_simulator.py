@@ -4,11 +4,38 @@ numerical scheme. This engine takes a financial model (with defined drift and di
 and simulates paths accordingly.
 """
 
+from ..instrumentation import count, timer
 from ..models import BaseModel, BlackScholes
+from .path_store import PathLike, PathStore, default_block_size
+from .rng import NormalPipeline
 
 import numpy as np
+import numpy.typing as npt
 
-from typing import Literal
+from typing import Iterator, Literal, Optional
+
+# Size of the float64 chunks drawn from the global `np.random` state for other dtypes.
+_GLOBAL_NORMALS_CHUNK_BYTES = 2**20
+
+
+def _global_normals(shape: tuple[int, ...], scale: float, dtype: np.dtype) -> np.ndarray:
+    """
+    Draw normal increments from the global `np.random` state directly into an array of `dtype`.
+
+    `np.random.normal` only draws float64, so other dtypes are filled in small chunks along the
+    first axis instead of converting a full float64 array. The draws are in the same order, so
+    seeded results do not depend on the dtype or the chunking.
+    """
+    if dtype == np.float64:
+        return np.random.normal(scale=scale, size=shape)
+
+    dw = np.empty(shape, dtype=dtype)
+    row_bytes = 8 * int(np.prod(shape[1:]))
+    rows = max(1, _GLOBAL_NORMALS_CHUNK_BYTES // row_bytes)
+    for start in range(0, shape[0], rows):
+        stop = min(start + rows, shape[0])
+        dw[start:stop] = np.random.normal(scale=scale, size=(stop - start, *shape[1:]))
+    return dw
 
 
 class PathSimulator:
@@ -35,6 +62,12 @@ class PathSimulator:
         n_paths: int,
         *,
         scheme: Literal["euler", "exact"] = "euler",
+        dtype: npt.DTypeLike = np.float64,
+        layout: Literal["path_major", "time_major"] = "path_major",
+        rng: Optional[np.random.Generator] = None,
+        out: Optional[np.ndarray] = None,
+        increments: Optional[np.ndarray] = None,
+        normals: Optional[NormalPipeline] = None,
     ) -> np.ndarray:
         """
         Simulate asset price paths using the provided model dynamics and numerical scheme.
@@ -51,30 +84,251 @@ class PathSimulator:
             Number of simulation paths.
         scheme : str, optional
             Simulation scheme to use, by default "euler"
+        dtype : DTypeLike, optional
+            Floating point type of the paths and of the Brownian increments, by default float64.
+            float32 halves the memory and bandwidth of the simulation.
+        layout : str, optional
+            Memory layout of the returned paths, by default "path_major".
+            "path_major" returns an array of shape (n_paths, n_steps + 1, 1) and "time_major" an array of
+            shape (n_steps + 1, n_paths, 1), where each time step is contiguous in memory.
+        rng : np.random.Generator, optional
+            Generator of the Brownian increments, drawn directly in `dtype`.
+            If None, the global `np.random` state is used.
+        out : np.ndarray, optional
+            Array of the shape and dtype implied by `layout` and `dtype` into which the paths are written,
+            e.g. a view of a `np.memmap`. If None, a new array is allocated.
+        increments : np.ndarray, optional
+            Brownian increments dW of shape (n_paths, n_steps, 1), or (n_steps, n_paths, 1) for the
+            "time_major" layout, to drive the simulation instead of drawing new ones. Used to couple
+            simulations on different time grids.
+        normals : NormalPipeline, optional
+            Pipeline drawing the Brownian increments block by block in background threads while the
+            previous block is stepped. The full array of increments is then never allocated. The paths
+            are the same for any number of threads, `n_threads=0` giving the non-pipelined reference,
+            but differ from those of `rng`, see `NormalPipeline`.
 
         Returns
         -------
         np.ndarray
             An array of simulated asset price paths.
         """
+        dtype = np.dtype(dtype)
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(f"dtype must be a floating point type, got {dtype}")
+        if layout not in ("path_major", "time_major"):
+            raise ValueError(f"Unknown layout: {layout}")
+
         dt = t1 / n_steps
-        paths = np.empty((n_paths, n_steps + 1, 1))
-        paths[:, 0] = s0
-        dw = np.random.normal(scale=np.sqrt(dt), size=(n_paths, n_steps, 1))
-
-        if scheme.lower() == "euler":
-            for i in range(n_steps):
-                drift = self.model.drift(i * dt, paths[:, i])
-                diffusion = self.model.diffusion(i * dt, paths[:, i])
-                paths[:, i + 1] = paths[:, i] + drift * dt + diffusion * dw[:, i]
-        elif scheme.lower() == "exact":
-            if isinstance(self.model, BlackScholes):
-                mu = self.model.interest_rate
-                sigma = self.model.sigma
-                paths[:, 1:] = s0 * np.cumprod(np.exp((mu - sigma**2 / 2) * dt + sigma * dw), axis=1)
-            else:
-                raise ValueError(f"Model is not exactly simulable")
+        if layout == "path_major":
+            shape, dw_shape = (n_paths, n_steps + 1, 1), (n_paths, n_steps, 1)
         else:
+            shape, dw_shape = (n_steps + 1, n_paths, 1), (n_steps, n_paths, 1)
+
+        if out is None:
+            paths = np.empty(shape, dtype=dtype)
+        elif out.shape != shape or out.dtype != dtype:
+            raise ValueError(f"out must have shape {shape} and dtype {dtype}, got {out.shape} and {out.dtype}")
+        else:
+            paths = out
+
+        if sum(source is not None for source in (rng, increments, normals)) > 1:
+            raise ValueError("Only one of rng, increments and normals can be given")
+
+        scheme = scheme.lower()
+        if scheme not in ("euler", "exact"):
             raise ValueError(f"Unknown simulation scheme: {scheme}")
+        if scheme == "exact" and not isinstance(self.model, BlackScholes):
+            raise ValueError("Model is not exactly simulable")
+
+        if normals is not None:
+            dw = None
+            # Blocks of time-major increments, starting at the given time step.
+            dw_blocks = normals.blocks(n_paths, n_steps, scale=np.sqrt(dt), dtype=dtype)
+        elif increments is not None:
+            if increments.shape != dw_shape:
+                raise ValueError(f"increments must have shape {dw_shape}, got {increments.shape}")
+            dw = increments.astype(dtype, copy=False)
+        else:
+            with timer("simulate.rng"):
+                if rng is None:
+                    dw = _global_normals(dw_shape, np.sqrt(dt), dtype)
+                else:
+                    dw = rng.standard_normal(dw_shape, dtype=dtype)
+                    dw *= np.sqrt(dt)
+
+        if dw is not None:
+            dw_blocks = [(0, np.moveaxis(dw, 1, 0) if layout == "path_major" else dw)]
+
+        count("simulate.paths", n_paths)
+        count("simulate.steps", n_steps)
+        allocated = (paths.nbytes if out is None else 0) + (dw.nbytes if dw is not None and dw is not increments else 0)
+        count("simulate.bytes_allocated", allocated)
+
+        # Step through time-major views, strided for the path-major layout.
+        steps = np.moveaxis(paths, 1, 0) if layout == "path_major" else paths
+        steps[0] = s0
+
+        for start, dw_steps in dw_blocks:
+            if scheme == "euler":
+                for j in range(len(dw_steps)):
+                    i = start + j
+                    with timer("simulate.step"):
+                        drift = self.model.drift(i * dt, steps[i])
+                        diffusion = self.model.diffusion(i * dt, steps[i])
+                        steps[i + 1] = steps[i] + drift * dt + diffusion * dw_steps[j]
+            else:
+                mu = self.model.interest_rate
+                sigma = self.model.sigma
+                stop = start + len(dw_steps)
+                with timer("simulate.exact"):
+                    growth = np.cumprod(np.exp((mu - sigma**2 / 2) * dt + sigma * dw_steps), axis=0)
+                    steps[start + 1 : stop + 1] = steps[start] * growth
 
         return paths
+
+    def iterate(
+        self,
+        s0: float,
+        t1: float,
+        n_steps: int,
+        n_paths: int,
+        *,
+        scheme: Literal["euler", "exact"] = "euler",
+        dtype: npt.DTypeLike = np.float64,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Step asset prices through time, yielding the prices at each grid point instead of storing the paths.
+
+        The Brownian increments are drawn one time step at a time, so memory does not grow with `n_steps`.
+        This is meant for payoffs computed as running quantities, see `BarrierContract.running_payoff`.
+
+        Parameters
+        ----------
+        s0 : float
+            Initial asset price.
+        t1 : float
+            Total simulation time.
+        n_steps : int
+            Number of time steps.
+        n_paths : int
+            Number of simulation paths.
+        scheme : str, optional
+            Simulation scheme to use, by default "euler"
+        dtype : DTypeLike, optional
+            Floating point type of the prices, by default float64.
+        rng : np.random.Generator, optional
+            Generator of the Brownian increments. If None, the global `np.random` state is used.
+
+        Yields
+        ------
+        np.ndarray
+            The asset prices of shape (n_paths, 1) at each of the n_steps + 1 grid points.
+        """
+        dtype = np.dtype(dtype)
+        scheme = scheme.lower()
+        if scheme not in ("euler", "exact"):
+            raise ValueError(f"Unknown simulation scheme: {scheme}")
+        if scheme == "exact" and not isinstance(self.model, BlackScholes):
+            raise ValueError("Model is not exactly simulable")
+
+        dt = t1 / n_steps
+        s = np.full((n_paths, 1), s0, dtype=dtype)
+        yield s
+
+        for i in range(n_steps):
+            with timer("simulate.rng"):
+                if rng is None:
+                    dw = np.random.normal(scale=np.sqrt(dt), size=(n_paths, 1)).astype(dtype, copy=False)
+                else:
+                    dw = rng.standard_normal((n_paths, 1), dtype=dtype)
+                    dw *= np.sqrt(dt)
+
+            with timer("simulate.step"):
+                if scheme == "euler":
+                    s = s + self.model.drift(i * dt, s) * dt + self.model.diffusion(i * dt, s) * dw
+                else:
+                    mu = self.model.interest_rate
+                    sigma = self.model.sigma
+                    s = s * np.exp((mu - sigma**2 / 2) * dt + sigma * dw)
+            yield s
+
+    def simulate_to_store(
+        self,
+        directory: PathLike,
+        s0: float,
+        t1: float,
+        n_steps: int,
+        n_paths: int,
+        *,
+        scheme: Literal["euler", "exact"] = "euler",
+        dtype: npt.DTypeLike = np.float64,
+        layout: Literal["path_major", "time_major"] = "path_major",
+        seed: Optional[int] = None,
+        block_size: Optional[int] = None,
+        overwrite: bool = False,
+    ) -> PathStore:
+        """
+        Simulate asset price paths block by block directly into an on-disk `PathStore`.
+
+        Only one block of paths and Brownian increments is held in memory at a time, so the
+        simulation can be larger than RAM. The model, parameters, seed and grid are recorded in
+        the store metadata, and the store can be reopened with `PathStore.open` once every path
+        is written.
+
+        Parameters
+        ----------
+        directory : PathLike
+            Directory of the store.
+        s0 : float
+            Initial asset price.
+        t1 : float
+            Total simulation time.
+        n_steps : int
+            Number of time steps.
+        n_paths : int
+            Number of simulation paths.
+        scheme : str, optional
+            Simulation scheme to use, by default "euler"
+        dtype : DTypeLike, optional
+            Floating point type of the paths, by default float64.
+        layout : str, optional
+            Memory layout of the stored paths, by default "path_major".
+        seed : int, optional
+            Seed of the `np.random.Generator` drawing the increments. If None, fresh entropy is drawn
+            from the OS, and recorded as the seed so that the store can be regenerated.
+        block_size : int, optional
+            Number of paths simulated at once, by default about 64MB of paths per block.
+        overwrite : bool, optional
+            Whether to replace an existing store, by default False.
+
+        Returns
+        -------
+        PathStore
+            The store holding the simulated paths.
+        """
+        block_size = block_size or default_block_size(n_steps, dtype)
+        seed_sequence = np.random.SeedSequence(seed)
+        metadata = {
+            "model": type(self.model).__name__,
+            "parameters": self.model.parameters,
+            "s0": s0,
+            "t1": t1,
+            "scheme": scheme,
+            "seed": seed_sequence.entropy,
+            "block_size": block_size,
+        }
+        store = PathStore.create(
+            directory, n_paths, n_steps, dtype=dtype, layout=layout, metadata=metadata, overwrite=overwrite
+        )
+
+        rng = np.random.default_rng(seed_sequence)
+        for start in range(0, n_paths, block_size):
+            stop = min(start + block_size, n_paths)
+            out = store.paths[start:stop] if layout == "path_major" else store.paths[:, start:stop]
+            self.simulate(
+                s0, t1, n_steps, stop - start, scheme=scheme, dtype=dtype, layout=layout, rng=rng, out=out
+            )
+
+        store.mark_complete()
+        return store
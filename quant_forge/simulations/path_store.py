@@ -0,0 +1,231 @@
+"""
+Provides an on-disk store for simulated paths. Paths are kept in a `.npy` file that is
+memory-mapped on open, so a single simulation larger than RAM can be written once and
+streamed block by block through any number of contracts.
+"""
+
+from ..contracts import Contract
+
+import numpy as np
+import numpy.typing as npt
+
+import json
+import os
+
+from typing import Iterator, Literal, Optional, Union
+
+PathLike = Union[str, os.PathLike]
+
+# Target size of the blocks of paths simulated or streamed at once.
+DEFAULT_BLOCK_BYTES = 64 * 2**20
+
+
+def default_block_size(n_steps: int, dtype: npt.DTypeLike) -> int:
+    """
+    Number of paths of `n_steps` steps such that a block takes about `DEFAULT_BLOCK_BYTES`.
+    """
+    path_bytes = (n_steps + 1) * np.dtype(dtype).itemsize
+    return max(1, DEFAULT_BLOCK_BYTES // path_bytes)
+
+
+class PathStore:
+    """
+    Simulated asset price paths stored in a directory, as a memory-mapped `paths.npy`
+    array and a `metadata.json` file describing the simulation.
+
+    A store is marked complete in its metadata once every path is written, by `mark_complete`,
+    so a simulation interrupted half way does not leave a store that opens as valid.
+    """
+
+    PATHS_FILE = "paths.npy"
+    METADATA_FILE = "metadata.json"
+
+    def __init__(self, directory: PathLike, paths: np.memmap, metadata: dict):
+        """
+        Wrap an opened store, use `PathStore.create` or `PathStore.open` instead.
+
+        Parameters
+        ----------
+        directory : PathLike
+            Directory of the store.
+        paths : np.memmap
+            The memory-mapped paths.
+        metadata : dict
+            The simulation metadata.
+        """
+        self._directory = os.fspath(directory)
+        self._paths = paths
+        self._metadata = metadata
+
+    @classmethod
+    def create(
+        cls,
+        directory: PathLike,
+        n_paths: int,
+        n_steps: int,
+        *,
+        dtype: npt.DTypeLike = np.float64,
+        layout: Literal["path_major", "time_major"] = "path_major",
+        metadata: Optional[dict] = None,
+        overwrite: bool = False,
+    ) -> "PathStore":
+        """
+        Create an empty store, writable in place, and incomplete until `mark_complete` is called.
+
+        Parameters
+        ----------
+        directory : PathLike
+            Directory of the store, created if it does not exist.
+        n_paths : int
+            Number of paths.
+        n_steps : int
+            Number of time steps.
+        dtype : DTypeLike, optional
+            Floating point type of the paths, by default float64.
+        layout : str, optional
+            Memory layout of the paths, see `PathSimulator.simulate`, by default "path_major".
+        metadata : dict, optional
+            JSON serializable description of the simulation, e.g. model parameters, seed and grid.
+        overwrite : bool, optional
+            Whether to replace an existing store, by default False.
+
+        Returns
+        -------
+        PathStore
+            The new store.
+        """
+        if layout not in ("path_major", "time_major"):
+            raise ValueError(f"Unknown layout: {layout}")
+
+        os.makedirs(directory, exist_ok=True)
+        paths_file = os.path.join(directory, cls.PATHS_FILE)
+        if os.path.exists(paths_file) and not overwrite:
+            raise FileExistsError(f"A path store already exists in {directory}")
+
+        shape = (n_paths, n_steps + 1, 1) if layout == "path_major" else (n_steps + 1, n_paths, 1)
+        paths = np.lib.format.open_memmap(paths_file, mode="w+", dtype=np.dtype(dtype), shape=shape)
+
+        metadata = dict(metadata or {})
+        metadata.update(n_paths=n_paths, n_steps=n_steps, dtype=np.dtype(dtype).name, layout=layout, complete=False)
+        store = cls(directory, paths, metadata)
+        store._write_metadata()
+        return store
+
+    @classmethod
+    def open(cls, directory: PathLike, mode: Literal["r", "r+", "c"] = "r") -> "PathStore":
+        """
+        Open an existing complete store without reading the paths into memory.
+
+        Parameters
+        ----------
+        directory : PathLike
+            Directory of the store.
+        mode : str, optional
+            Memory-map mode of the paths, by default read-only ("r").
+
+        Returns
+        -------
+        PathStore
+            The opened store.
+
+        Raises
+        ------
+        ValueError
+            If the store was never marked complete, e.g. after an interrupted simulation.
+        """
+        with open(os.path.join(directory, cls.METADATA_FILE)) as f:
+            metadata = json.load(f)
+        if not metadata.get("complete", False):
+            raise ValueError(f"The path store in {directory} is incomplete")
+        paths = np.load(os.path.join(directory, cls.PATHS_FILE), mmap_mode=mode)
+        return cls(directory, paths, metadata)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def paths(self) -> np.memmap:
+        return self._paths
+
+    @property
+    def metadata(self) -> dict:
+        return self._metadata
+
+    @property
+    def n_paths(self) -> int:
+        return self._metadata["n_paths"]
+
+    @property
+    def n_steps(self) -> int:
+        return self._metadata["n_steps"]
+
+    @property
+    def layout(self) -> Literal["path_major", "time_major"]:
+        return self._metadata["layout"]
+
+    @property
+    def complete(self) -> bool:
+        return self._metadata["complete"]
+
+    def blocks(self, block_size: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Iterate over consecutive blocks of paths, as views of the memory map in the store layout.
+
+        Parameters
+        ----------
+        block_size : int, optional
+            Number of paths per block, by default about `DEFAULT_BLOCK_BYTES` of paths.
+
+        Yields
+        ------
+        np.ndarray
+            A block of paths.
+        """
+        block_size = block_size or default_block_size(self.n_steps, self._paths.dtype)
+        for start in range(0, self.n_paths, block_size):
+            stop = min(start + block_size, self.n_paths)
+            if self.layout == "path_major":
+                yield self._paths[start:stop]
+            else:
+                yield self._paths[:, start:stop]
+
+    def payoff(self, contract: Contract, block_size: Optional[int] = None) -> np.ndarray:
+        """
+        Evaluate the payoff of `contract` on every stored path, streaming over blocks.
+
+        Parameters
+        ----------
+        contract : Contract
+            The contract to evaluate.
+        block_size : int, optional
+            Number of paths per block, by default about `DEFAULT_BLOCK_BYTES` of paths.
+
+        Returns
+        -------
+        np.ndarray
+            The payoff of each path.
+        """
+        return np.concatenate([contract.payoff(block, layout=self.layout) for block in self.blocks(block_size)])
+
+    def flush(self) -> None:
+        """
+        Write any pending changes of the paths to disk.
+        """
+        if isinstance(self._paths, np.memmap):
+            self._paths.flush()
+
+    def mark_complete(self) -> None:
+        """
+        Flush the paths to disk and mark the store complete, so that it can be opened.
+        """
+        self.flush()
+        self._metadata["complete"] = True
+        self._write_metadata()
+
+    def _write_metadata(self) -> None:
+        # Write to a temporary file first, so that the metadata is never left half written.
+        metadata_file = os.path.join(self._directory, self.METADATA_FILE)
+        with open(metadata_file + ".tmp", "w") as f:
+            json.dump(self._metadata, f, indent=2)
+        os.replace(metadata_file + ".tmp", metadata_file)
@@ -0,0 +1,118 @@
+"""
+Provides a pipelined generator of Brownian increments. Blocks of time steps are drawn by a pool
+of background threads while the simulator steps through the previous block, which overlaps
+random number generation with the rest of the simulation since NumPy generators release the GIL.
+"""
+
+from ..instrumentation import timer
+
+import numpy as np
+import numpy.typing as npt
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+
+class NormalPipeline:
+    """
+    A bounded queue of blocks of Gaussian increments, filled ahead of use by producer threads.
+
+    Every block is drawn from its own independent stream, spawned from the seed in block order,
+    so the output only depends on the seed and the block size, not on the number of threads.
+    The non-pipelined reference is `n_threads=0`, which draws the same blocks synchronously.
+    The increments differ from those drawn by `np.random.default_rng(seed)` in one call, since
+    a single stream cannot be drawn by several threads at once.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        *,
+        n_threads: int = 1,
+        block_steps: int = 16,
+        buffer_size: int = 2,
+    ):
+        """
+        Initialize the pipeline.
+
+        Parameters
+        ----------
+        seed : int, optional
+            Seed of the increments, by default fresh entropy from the OS.
+        n_threads : int, optional
+            Number of producer threads, by default 1. With 0, blocks are drawn synchronously
+            in the calling thread, which gives the same output.
+        block_steps : int, optional
+            Number of time steps per block, by default 16.
+        buffer_size : int, optional
+            Maximum number of blocks drawn ahead of the block in use, by default 2 (double buffering).
+            At least `n_threads` blocks are drawn ahead, so that no producer thread sits idle.
+        """
+        if n_threads < 0 or block_steps < 1 or buffer_size < 1:
+            raise ValueError("n_threads must be non-negative, block_steps and buffer_size positive")
+
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self.n_threads = n_threads
+        self.block_steps = block_steps
+        self.buffer_size = buffer_size
+
+    def blocks(
+        self,
+        n_paths: int,
+        n_steps: int,
+        *,
+        scale: float = 1.0,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Iterate over the blocks of increments of one simulation.
+
+        Each call draws new increments, from the next stream spawned from the seed.
+
+        Parameters
+        ----------
+        n_paths : int
+            Number of simulation paths.
+        n_steps : int
+            Number of time steps.
+        scale : float, optional
+            Standard deviation of the increments, e.g. sqrt(dt), by default 1.
+        dtype : DTypeLike, optional
+            Floating point type of the increments, by default float64.
+
+        Yields
+        ------
+        tuple[int, np.ndarray]
+            The index of the first time step of the block, and the increments of shape
+            (block_steps, n_paths, 1), the last block being possibly shorter.
+        """
+        n_blocks = (n_steps + self.block_steps - 1) // self.block_steps
+        block_sequences = self._seed_sequence.spawn(1)[0].spawn(n_blocks)
+        dtype = np.dtype(dtype)
+
+        def generate(k: int) -> tuple[int, np.ndarray]:
+            start = k * self.block_steps
+            length = min(self.block_steps, n_steps - start)
+            block = np.random.default_rng(block_sequences[k]).standard_normal((length, n_paths, 1), dtype=dtype)
+            block *= scale
+            return start, block
+
+        if self.n_threads == 0:
+            for k in range(n_blocks):
+                with timer("simulate.rng"):
+                    block = generate(k)
+                yield block
+            return
+
+        lookahead = max(self.buffer_size, self.n_threads)
+        with ThreadPoolExecutor(max_workers=self.n_threads) as executor:
+            pending = deque(executor.submit(generate, k) for k in range(min(lookahead, n_blocks)))
+            next_block = len(pending)
+            while pending:
+                with timer("simulate.rng"):
+                    block = pending.popleft().result()
+                if next_block < n_blocks:
+                    pending.append(executor.submit(generate, next_block))
+                    next_block += 1
+                yield block
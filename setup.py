@@ -11,10 +11,14 @@ def main() -> None:
         install_requires=[
             "numpy",
             "scipy",
-            "pandas",
-            "matplotlib",
-            "yfinance",
         ],
+        extras_require={
+            "market": [
+                "pandas",
+                "plotly",
+                "yfinance",
+            ],
+        },
     )
 
 
@@ -0,0 +1,69 @@
+from quant_forge.contracts import BarrierCall, BarrierPut
+from quant_forge.models import BlackScholes
+from quant_forge.simulations import PathSimulator
+
+import numpy as np
+import pytest
+
+from scipy.stats import norm
+
+S0, STRIKE, BARRIER, MATURITY, INTEREST_RATE, SIGMA = 100.0, 100.0, 120.0, 1.0, 0.03, 0.2
+
+
+def up_and_out_call(s, strike, barrier, t, r, sigma):
+    """
+    Reiner-Rubinstein price of a continuously monitored up-and-out call, strike below the barrier.
+    """
+    st = sigma * np.sqrt(t)
+    mu = (r - sigma**2 / 2) / sigma**2
+    shift = (1 + mu) * st
+    x1 = np.log(s / strike) / st + shift
+    x2 = np.log(s / barrier) / st + shift
+    y1 = np.log(barrier**2 / (s * strike)) / st + shift
+    y2 = np.log(barrier / s) / st + shift
+    df = np.exp(-r * t)
+    ratio = barrier / s
+
+    a = s * norm.cdf(x1) - strike * df * norm.cdf(x1 - st)
+    b = s * norm.cdf(x2) - strike * df * norm.cdf(x2 - st)
+    c = s * ratio ** (2 * (mu + 1)) * norm.cdf(-y1) - strike * df * ratio ** (2 * mu) * norm.cdf(-y1 + st)
+    d = s * ratio ** (2 * (mu + 1)) * norm.cdf(-y2) - strike * df * ratio ** (2 * mu) * norm.cdf(-y2 + st)
+    return a - b + c - d
+
+
+@pytest.mark.parametrize("n_steps", [10, 50])
+def test_coarse_grid_prices_like_continuous_monitoring(n_steps):
+    simulator = PathSimulator(BlackScholes(INTEREST_RATE, SIGMA))
+    paths = simulator.simulate(S0, MATURITY, n_steps, 200_000, scheme="exact", rng=np.random.default_rng(0))
+    option = BarrierCall(MATURITY, STRIKE, BARRIER, SIGMA, "up-and-out")
+    payoffs = np.exp(-INTEREST_RATE * MATURITY) * option.payoff(paths)
+
+    std_error = np.std(payoffs) / np.sqrt(payoffs.size)
+    assert abs(np.mean(payoffs) - up_and_out_call(S0, STRIKE, BARRIER, MATURITY, INTEREST_RATE, SIGMA)) < 4 * std_error
+
+
+@pytest.mark.parametrize("contract_type, barrier, direction", [(BarrierCall, 120.0, "up"), (BarrierPut, 80.0, "down")])
+def test_in_out_parity(contract_type, barrier, direction):
+    paths = PathSimulator(BlackScholes(INTEREST_RATE, SIGMA)).simulate(
+        S0, MATURITY, 20, 10_000, scheme="exact", rng=np.random.default_rng(1)
+    )
+    knock_in = contract_type(MATURITY, STRIKE, barrier, SIGMA, f"{direction}-and-in").payoff(paths)
+    knock_out = contract_type(MATURITY, STRIKE, barrier, SIGMA, f"{direction}-and-out").payoff(paths)
+    sign = 1 if contract_type is BarrierCall else -1
+    vanilla = np.maximum(sign * (paths[:, -1] - STRIKE), 0)
+
+    np.testing.assert_allclose(knock_in + knock_out, vanilla)
+
+
+@pytest.mark.parametrize("scheme", ["euler", "exact"])
+def test_running_payoff_matches_stored_paths(scheme):
+    simulator = PathSimulator(BlackScholes(INTEREST_RATE, SIGMA))
+    option = BarrierCall(MATURITY, STRIKE, BARRIER, SIGMA, "up-and-out")
+
+    # Time-major paths draw the increments step by step, like `iterate`.
+    paths = simulator.simulate(
+        S0, MATURITY, 20, 10_000, scheme=scheme, layout="time_major", rng=np.random.default_rng(2)
+    )
+    states = simulator.iterate(S0, MATURITY, 20, 10_000, scheme=scheme, rng=np.random.default_rng(2))
+
+    np.testing.assert_allclose(option.running_payoff(states, 20), option.payoff(paths, layout="time_major"))
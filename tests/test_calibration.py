@@ -0,0 +1,47 @@
+from quant_forge.calibration import OptionSurface, calibrate_surface, calibrate_surfaces
+from quant_forge.models import BlackScholes
+
+import numpy as np
+import pytest
+
+STRIKES = np.tile([80.0, 90.0, 100.0, 110.0, 120.0], 3)
+MATURITIES = np.repeat([0.25, 0.5, 1.0], 5)
+OPTION_TYPES = np.where(STRIKES < 100.0, "put", "call")
+INITIAL = {"interest_rate": 0.01, "sigma": 0.4}
+
+
+def surface(interest_rate: float = 0.04, sigma: float = 0.25) -> OptionSurface:
+    prices = BlackScholes(interest_rate, sigma).price(100.0, STRIKES, MATURITIES, OPTION_TYPES)
+    return OptionSurface(100.0, STRIKES, MATURITIES, prices, OPTION_TYPES)
+
+
+@pytest.mark.parametrize("jacobian", ["analytic", "cs", "2-point", "3-point"])
+def test_recovers_the_parameters(jacobian):
+    result = calibrate_surface(BlackScholes, surface(), INITIAL, jacobian=jacobian)
+
+    assert result.success
+    assert result.parameters["interest_rate"] == pytest.approx(0.04, abs=1e-6)
+    assert result.parameters["sigma"] == pytest.approx(0.25, abs=1e-6)
+    assert result.rmse < 1e-6
+
+
+def test_fixed_parameters_and_bounds_are_respected():
+    result = calibrate_surface(BlackScholes, surface(), INITIAL, fixed={"interest_rate": 0.04})
+    assert result.parameters["interest_rate"] == 0.04
+    assert result.parameters["sigma"] == pytest.approx(0.25, abs=1e-6)
+
+    result = calibrate_surface(BlackScholes, surface(), INITIAL, bounds={"sigma": (0.3, 1.0)})
+    assert 0.3 <= result.parameters["sigma"] <= 1.0
+    assert result.parameters["sigma"] == pytest.approx(0.3)
+
+
+def test_parallel_calibration_matches_serial():
+    surfaces = {"A": surface(0.04, 0.25), "B": surface(0.02, 0.35), "C": surface(0.05, 0.15)}
+    warm_start = {"B": {"sigma": 0.3}}
+
+    serial = calibrate_surfaces(BlackScholes, surfaces, INITIAL, warm_start=warm_start, max_workers=1)
+    parallel = calibrate_surfaces(BlackScholes, surfaces, INITIAL, warm_start=warm_start, max_workers=2)
+
+    assert list(serial) == list(parallel) == list(surfaces)
+    for ticker in surfaces:
+        assert parallel[ticker].parameters == serial[ticker].parameters
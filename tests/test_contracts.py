@@ -0,0 +1,45 @@
+from quant_forge.contracts import (
+    AsianCall,
+    AsianPut,
+    BarrierCall,
+    BarrierPut,
+    DigitalCall,
+    DigitalPut,
+    EuropeanCall,
+    EuropeanPut,
+    Lookback,
+)
+from quant_forge.models import BlackScholes
+from quant_forge.simulations import PathSimulator
+
+import numpy as np
+import pytest
+
+CONTRACTS = [
+    EuropeanCall(1.0, 100.0),
+    EuropeanPut(1.0, 100.0),
+    AsianCall(1.0, 100.0),
+    AsianPut(1.0, 100.0),
+    DigitalCall(1.0, 100.0, 10.0),
+    DigitalPut(1.0, 100.0, 10.0),
+    Lookback(1.0, 0.2),
+    BarrierCall(1.0, 100.0, 120.0, 0.2, "up-and-out"),
+    BarrierPut(1.0, 100.0, 80.0, 0.2, "down-and-in"),
+]
+
+
+@pytest.mark.parametrize("contract", CONTRACTS, ids=lambda contract: type(contract).__name__)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_payoff_does_not_depend_on_the_layout(contract, dtype):
+    simulator = PathSimulator(BlackScholes(0.03, 0.2))
+    path_major = simulator.simulate(100.0, 1.0, 20, 1_000, dtype=dtype, rng=np.random.default_rng(0))
+    time_major = np.ascontiguousarray(np.moveaxis(path_major, 1, 0))
+
+    expected = contract.payoff(path_major)
+    actual = contract.payoff(time_major, layout="time_major")
+
+    assert expected.dtype == dtype
+    assert actual.dtype == dtype
+    # Sums over time may be accumulated in a different order, up to rounding of the prices.
+    tol = np.finfo(dtype).eps * 100.0 * 100
+    np.testing.assert_allclose(actual, expected, rtol=tol, atol=tol)
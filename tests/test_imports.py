@@ -0,0 +1,63 @@
+"""
+Startup budget of `import quant_forge` and of the core subpackages, measured in fresh
+interpreters. See `benchmarks/imports.py` for the timings tracked over time.
+"""
+
+import pytest
+
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "plotly", "yfinance", "scipy.stats", "scipy.optimize", "scipy.interpolate"]
+
+# Import time budget in seconds, numpy included, best of a few fresh interpreters.
+IMPORT_BUDGET = 0.5
+
+_IMPORT = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - start
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+# Concurrent first uses of lazily imported modules, in a fresh interpreter.
+_FIRST_USE = """
+from concurrent.futures import ThreadPoolExecutor
+from quant_forge.calibration import surface
+from quant_forge.models.black_scholes import black_scholes_price
+
+def first_use(i):
+    if i % 2:
+        return black_scholes_price(100.0, 100.0, 1.0, 0.03, 0.2, "call")
+    return surface.optimize.least_squares
+
+with ThreadPoolExecutor(16) as executor:
+    futures = [executor.submit(first_use, i) for i in range(16)]
+print(sum(future.exception() is not None for future in futures))
+"""
+
+
+def _import(module: str) -> dict:
+    code = _IMPORT.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout)
+
+
+@pytest.mark.parametrize("module", ["quant_forge", "quant_forge.simulations", "quant_forge.contracts"])
+def test_import_does_not_load_heavy_modules(module):
+    assert _import(module)["loaded"] == []
+
+
+@pytest.mark.parametrize("module", ["quant_forge", "quant_forge.simulations"])
+def test_import_time_budget(module):
+    elapsed = min(_import(module)["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET, f"import {module} took {elapsed:.3f}s, budget {IMPORT_BUDGET}s"
+
+
+def test_concurrent_first_use_of_lazy_modules():
+    for _ in range(3):
+        output = subprocess.run([sys.executable, "-c", _FIRST_USE], capture_output=True, text=True, check=True)
+        assert int(output.stdout) == 0
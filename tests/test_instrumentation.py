@@ -0,0 +1,58 @@
+from quant_forge.contracts import BarrierCall, BarrierPut, EuropeanCall
+from quant_forge.instrumentation import Stats, instrument
+
+import numpy as np
+
+import threading
+
+PATHS = np.linspace(90.0, 110.0, 5 * 11).reshape(5, 11, 1)
+
+
+class CappedCall(EuropeanCall):
+    def payoff(self, paths, **kwargs):
+        return np.minimum(super().payoff(paths, **kwargs), 5.0)
+
+
+def test_payoffs_are_recorded_under_the_contract_class():
+    with instrument() as stats:
+        BarrierCall(1.0, 100.0, 120.0, 0.2, "up-and-out").payoff(PATHS)
+        BarrierPut(1.0, 100.0, 80.0, 0.2, "down-and-out").payoff(PATHS)
+
+    assert stats.counters["payoff.BarrierCall.paths"] == 5
+    assert stats.counters["payoff.BarrierPut.paths"] == 5
+    assert "payoff.BarrierContract.paths" not in stats.counters
+
+
+def test_payoff_calling_super_is_recorded_once():
+    with instrument() as stats:
+        CappedCall(1.0, 100.0).payoff(PATHS)
+        EuropeanCall(1.0, 100.0).payoff(PATHS)
+
+    assert stats.counters["payoff.CappedCall.paths"] == 5
+    assert stats.counters["payoff.EuropeanCall.paths"] == 5
+    assert stats.timers["payoff.CappedCall"].count == 1
+
+
+def test_stats_can_be_read_while_recording():
+    stats = Stats()
+    stop = threading.Event()
+
+    def record():
+        i = 0
+        while not stop.is_set():
+            stats.add(f"counter.{i % 1_000}")
+            stats.record_time(f"timer.{i % 1_000}", 1e-6)
+            i += 1
+
+    thread = threading.Thread(target=record)
+    thread.start()
+    try:
+        for _ in range(200):
+            repr(stats)
+            counters, timers = stats.counters, stats.timers
+            counters["counter.0"] = -1
+            assert stats.counters.get("counter.0") != -1
+    finally:
+        stop.set()
+        thread.join()
+    assert sum(timer.count for timer in timers.values()) <= sum(t.count for t in stats.timers.values())
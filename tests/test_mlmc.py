@@ -0,0 +1,42 @@
+from quant_forge.contracts import EuropeanCall
+from quant_forge.models import BlackScholes
+from quant_forge.models.black_scholes import black_scholes_price
+from quant_forge.simulations import MultilevelMonteCarlo
+
+import numpy as np
+
+INTEREST_RATE, SIGMA = 0.03, 0.2
+
+
+def test_estimate_reaches_the_target_rmse():
+    engine = MultilevelMonteCarlo(BlackScholes(INTEREST_RATE, SIGMA))
+    contract = EuropeanCall(1.0, 100.0)
+    expected = black_scholes_price(100.0, 100.0, 1.0, INTEREST_RATE, SIGMA, "call")
+
+    errors = []
+    for seed in range(10):
+        result = engine.estimate(
+            contract, 100.0, 0.05, discount_factor=np.exp(-INTEREST_RATE), rng=np.random.default_rng(seed)
+        )
+        assert result.converged
+        assert result.n_levels == len(result.n_samples) >= 2
+        errors.append(result.price - expected)
+
+    # The target is a root mean square error, so single estimates may exceed it.
+    assert np.sqrt(np.mean(np.square(errors))) < 0.05 * 1.5
+
+
+def test_estimate_stops_at_max_levels():
+    engine = MultilevelMonteCarlo(BlackScholes(INTEREST_RATE, SIGMA))
+    result = engine.estimate(
+        EuropeanCall(1.0, 100.0),
+        100.0,
+        0.02,
+        discount_factor=np.exp(-INTEREST_RATE),
+        max_levels=2,
+        rng=np.random.default_rng(0),
+    )
+
+    assert result.n_levels == 2
+    assert not result.converged
+    assert result.cost == np.sum(result.n_samples * np.array([engine.level_cost(level) for level in range(2)]))
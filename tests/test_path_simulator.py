@@ -0,0 +1,32 @@
+from quant_forge.models import BlackScholes
+from quant_forge.simulations import PathSimulator
+
+import numpy as np
+import pytest
+
+import tracemalloc
+
+
+@pytest.mark.parametrize("layout", ["path_major", "time_major"])
+def test_global_state_draws_do_not_depend_on_dtype(layout):
+    simulator = PathSimulator(BlackScholes(0.03, 0.2))
+    np.random.seed(1)
+    paths = simulator.simulate(100.0, 1.0, 50, 5_000, dtype=np.float32, layout=layout)
+
+    np.random.seed(1)
+    shape = (5_000, 50, 1) if layout == "path_major" else (50, 5_000, 1)
+    dw = np.random.normal(scale=np.sqrt(1 / 50), size=shape).astype(np.float32)
+    expected = simulator.simulate(100.0, 1.0, 50, 5_000, dtype=np.float32, layout=layout, increments=dw)
+    np.testing.assert_array_equal(paths, expected)
+
+
+def test_float32_halves_the_peak_memory():
+    simulator = PathSimulator(BlackScholes(0.03, 0.2))
+    peaks = {}
+    for dtype in (np.float32, np.float64):
+        tracemalloc.start()
+        simulator.simulate(100.0, 1.0, 100, 20_000, dtype=dtype, layout="time_major")
+        peaks[dtype] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    assert peaks[np.float32] < 0.55 * peaks[np.float64]
@@ -0,0 +1,28 @@
+from quant_forge.contracts import EuropeanCall
+from quant_forge.models import BlackScholes
+from quant_forge.simulations import PathSimulator, PathStore
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("layout", ["path_major", "time_major"])
+def test_unseeded_store_can_be_regenerated(tmp_path, layout):
+    simulator = PathSimulator(BlackScholes(0.03, 0.2))
+    store = simulator.simulate_to_store(tmp_path / "a", 100.0, 1.0, 20, 1_000, layout=layout, block_size=300)
+
+    seed = PathStore.open(tmp_path / "a").metadata["seed"]
+    assert isinstance(seed, int)
+
+    again = simulator.simulate_to_store(tmp_path / "b", 100.0, 1.0, 20, 1_000, layout=layout, block_size=300, seed=seed)
+    np.testing.assert_array_equal(again.paths, store.paths)
+    np.testing.assert_array_equal(again.payoff(EuropeanCall(1.0, 100.0)), store.payoff(EuropeanCall(1.0, 100.0)))
+
+
+def test_incomplete_store_does_not_open(tmp_path):
+    store = PathStore.create(tmp_path, 10, 5)
+    with pytest.raises(ValueError, match="incomplete"):
+        PathStore.open(tmp_path)
+
+    store.mark_complete()
+    assert PathStore.open(tmp_path).complete
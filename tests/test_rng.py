@@ -0,0 +1,58 @@
+from quant_forge.models import BlackScholes
+from quant_forge.simulations import NormalPipeline, PathSimulator
+
+import numpy as np
+import pytest
+
+import threading
+import time
+
+
+@pytest.mark.parametrize("scheme", ["euler", "exact"])
+@pytest.mark.parametrize("layout", ["path_major", "time_major"])
+def test_pipelined_paths_match_the_synchronous_reference(scheme, layout):
+    simulator = PathSimulator(BlackScholes(0.03, 0.2))
+    reference = simulator.simulate(
+        100.0, 1.0, 50, 1_000, scheme=scheme, layout=layout, normals=NormalPipeline(5, n_threads=0)
+    )
+
+    for n_threads, buffer_size in [(1, 1), (2, 2), (4, 2), (4, 8)]:
+        normals = NormalPipeline(5, n_threads=n_threads, block_steps=16, buffer_size=buffer_size)
+        paths = simulator.simulate(100.0, 1.0, 50, 1_000, scheme=scheme, layout=layout, normals=normals)
+        np.testing.assert_array_equal(paths, reference)
+
+
+def test_pipeline_differs_from_a_single_stream_by_design():
+    simulator = PathSimulator(BlackScholes(0.03, 0.2))
+    pipelined = simulator.simulate(100.0, 1.0, 50, 1_000, normals=NormalPipeline(5))
+    single_stream = simulator.simulate(100.0, 1.0, 50, 1_000, rng=np.random.default_rng(5))
+
+    assert not np.array_equal(pipelined, single_stream)
+    # Both are Black-Scholes paths with the same law.
+    assert np.mean(pipelined[:, -1]) == pytest.approx(np.mean(single_stream[:, -1]), rel=0.05)
+
+
+def test_every_thread_draws_ahead(monkeypatch):
+    active, peak = 0, 0
+    lock = threading.Lock()
+    default_rng = np.random.default_rng
+
+    class SlowGenerator:
+        def __init__(self, seed):
+            self._rng = default_rng(seed)
+
+        def standard_normal(self, *args, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return self._rng.standard_normal(*args, **kwargs)
+
+    monkeypatch.setattr(np.random, "default_rng", SlowGenerator)
+    for _ in NormalPipeline(0, n_threads=4, block_steps=1, buffer_size=2).blocks(10, 8):
+        pass
+
+    assert peak == 4
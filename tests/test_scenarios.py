@@ -0,0 +1,95 @@
+from quant_forge.contracts import AsianCall, DigitalCall, DigitalPut, EuropeanCall, EuropeanPut, Lookback
+from quant_forge.models import BlackScholes
+from quant_forge.models.black_scholes import black_scholes_price, digital_price
+from quant_forge.risk import Position, revalue_scenarios
+from quant_forge.simulations import PathSimulator
+
+import numpy as np
+
+SPOT_SHOCKS = np.array([-0.1, 0.0, 0.1])
+VOL_SHOCKS = np.array([-0.05, 0.0, 0.05])
+INTEREST_RATE = 0.03
+
+
+def test_mixed_closed_form_book_matches_scalar_prices():
+    positions = [
+        Position(EuropeanCall(1.0, 100.0), 2.0, spot=100.0, sigma=0.2),
+        Position(EuropeanPut(0.5, 95.0), -1.0, spot=100.0, sigma=0.25),
+        Position(DigitalCall(1.0, 105.0, 10.0), 3.0, spot=100.0, sigma=0.2),
+        Position(DigitalPut(2.0, 90.0, 5.0), 1.0, spot=100.0, sigma=0.3),
+    ]
+    result = revalue_scenarios(positions, SPOT_SHOCKS, VOL_SHOCKS, INTEREST_RATE, chunk_size=3)
+
+    for n, position in enumerate(positions):
+        contract = position.contract
+        for i, spot_shock in enumerate(SPOT_SHOCKS):
+            for j, vol_shock in enumerate(VOL_SHOCKS):
+                args = (
+                    position.spot * (1 + spot_shock),
+                    contract.strike,
+                    contract.maturity,
+                    INTEREST_RATE,
+                    position.sigma + vol_shock,
+                )
+                if isinstance(contract, (EuropeanCall, EuropeanPut)):
+                    option_type = "call" if isinstance(contract, EuropeanCall) else "put"
+                    expected = black_scholes_price(*args, option_type)
+                else:
+                    option_type = "call" if isinstance(contract, DigitalCall) else "put"
+                    expected = digital_price(*args, option_type, contract.payout)
+                np.testing.assert_allclose(result.values[n, i, j], position.quantity * expected)
+
+
+def test_monte_carlo_contracts_use_the_shocked_volatility():
+    contract = Lookback(1.0, 0.2)
+    position = Position(contract, spot=100.0, sigma=0.2)
+    result = revalue_scenarios([position], [0.0], [0.1], INTEREST_RATE, n_paths=1_000, n_steps=20, seed=7)
+
+    rng = np.random.default_rng(np.random.SeedSequence(7).spawn(1)[0])
+    paths = PathSimulator(BlackScholes(INTEREST_RATE, 0.3)).simulate(1.0, 1.0, 20, 1_000, scheme="exact", rng=rng)
+    expected = np.exp(-INTEREST_RATE) * np.mean(Lookback(1.0, 0.3).payoff(100.0 * paths))
+
+    np.testing.assert_allclose(result.values[0, 0, 0], expected)
+    assert contract.vol == 0.2
+
+
+def test_subclasses_overriding_the_payoff_are_revalued_by_monte_carlo():
+    class CappedCall(EuropeanCall):
+        def payoff(self, paths, **kwargs):
+            return np.minimum(super().payoff(paths, **kwargs), 5.0)
+
+    position = Position(CappedCall(1.0, 100.0), spot=100.0, sigma=0.2)
+    result = revalue_scenarios([position], [0.0], [0.0], INTEREST_RATE, n_paths=2_000, n_steps=1, seed=0)
+
+    assert result.base_values[0] < 5.0
+
+
+def test_ladders_use_the_unshocked_scenario():
+    positions = [Position(EuropeanCall(1.0, 100.0), spot=100.0, sigma=0.2)]
+    result = revalue_scenarios(positions, [-0.1, 0.1], [-0.05, 0.05], INTEREST_RATE)
+
+    base = black_scholes_price(100.0, 100.0, 1.0, INTEREST_RATE, 0.2, "call")
+    spot_ladder = [black_scholes_price(s, 100.0, 1.0, INTEREST_RATE, 0.2, "call") - base for s in (90.0, 110.0)]
+    vol_ladder = [black_scholes_price(100.0, 100.0, 1.0, INTEREST_RATE, v, "call") - base for v in (0.15, 0.25)]
+    np.testing.assert_allclose(result.spot_ladder(), spot_ladder)
+    np.testing.assert_allclose(result.vol_ladder(), vol_ladder)
+
+
+def test_monte_carlo_grid_matches_direct_simulations():
+    contract = AsianCall(1.0, 100.0)
+    position = Position(contract, 2.0, spot=100.0, sigma=0.2)
+    result = revalue_scenarios(
+        [position], SPOT_SHOCKS, VOL_SHOCKS, INTEREST_RATE, n_paths=1_000, n_steps=10, path_chunk_size=400, seed=3
+    )
+
+    seeds = np.random.SeedSequence(3).spawn(3)
+    for j, vol_shock in enumerate(VOL_SHOCKS):
+        simulator = PathSimulator(BlackScholes(INTEREST_RATE, 0.2 + vol_shock))
+        chunks = [
+            simulator.simulate(1.0, 1.0, 10, size, scheme="exact", rng=np.random.default_rng(chunk_seed))
+            for size, chunk_seed in zip([400, 400, 200], seeds)
+        ]
+        paths = np.concatenate(chunks)
+        for i, spot_shock in enumerate(SPOT_SHOCKS):
+            expected = 2.0 * np.exp(-INTEREST_RATE) * np.mean(contract.payoff(100.0 * (1 + spot_shock) * paths))
+            np.testing.assert_allclose(result.values[0, i, j], expected)
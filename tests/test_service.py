@@ -0,0 +1,81 @@
+from quant_forge.calibration import implied_volatility
+from quant_forge.instrumentation import Stats
+from quant_forge.models.black_scholes import black_scholes_price
+from quant_forge.service import PricingClient, PricingServer
+from quant_forge.service.server import _Coalescer
+
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+QUOTE = {"s": 100.0, "strike": [90.0, 100.0, 110.0], "time_to_maturity": 1.0, "interest_rate": 0.03, "sigma": 0.2}
+
+
+@pytest.fixture(scope="module")
+def client():
+    with PricingServer(n_workers=1, batch_window=0.2) as server:
+        yield PricingClient(server.url)
+
+
+def test_bad_request_does_not_fail_coalesced_requests(client):
+    def send(option_type):
+        try:
+            return client.price(**QUOTE, option_type=option_type)
+        except ValueError as e:
+            return e
+
+    with ThreadPoolExecutor(2) as executor:
+        good, bad = executor.map(send, ["call", "straddle"])
+
+    assert isinstance(bad, ValueError)
+    expected = [black_scholes_price(100.0, strike, 1.0, 0.03, 0.2, "call") for strike in QUOTE["strike"]]
+    assert good["price"] == pytest.approx(expected)
+
+
+def test_unknown_paths_do_not_create_metrics(client):
+    with pytest.raises(ValueError, match="Unknown path"):
+        client.request("no_such_kind", {})
+
+    metrics = client.metrics()
+    assert not any("no_such_kind" in name for group in ("counters", "timers") for name in metrics[group])
+
+
+def test_coalesced_implied_volatilities(client):
+    prices = client.price(**QUOTE, option_type="put")["price"]
+    request = {k: v for k, v in QUOTE.items() if k != "sigma"}
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [
+            executor.submit(client.implied_volatility, **request, market_price=prices, option_type="put")
+            for _ in range(3)
+        ]
+        responses = [future.result() for future in futures]
+
+    expected = [
+        implied_volatility(price, 100.0, strike, 1.0, 0.03, "put") for price, strike in zip(prices, QUOTE["strike"])
+    ]
+    for response in responses:
+        assert response["implied_volatility"] == pytest.approx(expected)
+
+
+def test_failed_batch_is_retried_request_by_request():
+    class Executor(ThreadPoolExecutor):
+        """Fails any batch holding a negative spot, which passes validation."""
+
+        def submit(self, function, kind, batch):
+            if (batch["s"] < 0).any():
+                return super().submit(_raise, RuntimeError("negative spot"))
+            return super().submit(function, kind, batch)
+
+    with Executor(1) as executor:
+        coalescer = _Coalescer("price", executor, Stats(), 0.2, 1_000_000)
+        good = coalescer.submit({**QUOTE, "option_type": "call"})
+        bad = coalescer.submit({**QUOTE, "s": -1.0, "option_type": "call"})
+
+        assert len(good.result()["price"]) == 3
+        assert isinstance(bad.exception(), RuntimeError)
+        coalescer.close()
+
+
+def _raise(error):
+    raise error